@@ -16,8 +16,6 @@ Documentation extension for analysis class.
 
 from typing import Any
 
-from docs._ext.custom_styles.styles import AnalysisDocstring
-from qiskit_experiments.framework.base_analysis import BaseAnalysis
 from sphinx.application import Sphinx
 from sphinx.ext.autodoc import ClassDocumenter
 
@@ -32,9 +30,14 @@ class AnalysisDocumenter(ClassDocumenter):
 
     @classmethod
     def can_document_member(cls, member: Any, membername: str, isattr: bool, parent: Any) -> bool:
+        # Importing qiskit_experiments is deferred until the first class is documented.
+        from qiskit_experiments.framework.base_analysis import BaseAnalysis
+
         return isinstance(member, BaseAnalysis)
 
     def add_content(self, more_content: Any, no_docstring: bool = False) -> None:
+        from docs._ext.custom_styles.styles import AnalysisDocstring
+
         sourcename = self.get_sourcename()
 
         # analysis class doesn't have explicit init method.
@@ -63,3 +66,5 @@ def setup(app: Sphinx):
     existing_documenter = app.registry.documenters.get(AnalysisDocumenter.objtype)
     if existing_documenter is None or not issubclass(existing_documenter, AnalysisDocumenter):
         app.add_autodocumenter(AnalysisDocumenter, override=True)
+
+    return {"parallel_read_safe": True, "parallel_write_safe": True}
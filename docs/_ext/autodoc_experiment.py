@@ -16,9 +16,6 @@ Documentation extension for experiment class.
 
 from typing import Any
 
-from docs._ext.custom_styles.styles import ExperimentDocstring
-from qiskit.exceptions import QiskitError
-from qiskit_experiments.framework.base_experiment import BaseExperiment
 from sphinx.application import Sphinx
 from sphinx.ext.autodoc import ClassDocumenter
 
@@ -33,9 +30,15 @@ class ExperimentDocumenter(ClassDocumenter):
 
     @classmethod
     def can_document_member(cls, member: Any, membername: str, isattr: bool, parent: Any) -> bool:
+        # Importing qiskit_experiments is deferred until the first class is documented.
+        from qiskit_experiments.framework.base_experiment import BaseExperiment
+
         return isinstance(member, BaseExperiment)
 
     def add_content(self, more_content: Any, no_docstring: bool = False) -> None:
+        from docs._ext.custom_styles.styles import ExperimentDocstring
+        from qiskit.exceptions import QiskitError
+
         sourcename = self.get_sourcename()
 
         try:
@@ -76,3 +79,5 @@ def setup(app: Sphinx):
     existing_documenter = app.registry.documenters.get(ExperimentDocumenter.objtype)
     if existing_documenter is None or not issubclass(existing_documenter, ExperimentDocumenter):
         app.add_autodocumenter(ExperimentDocumenter, override=True)
+
+    return {"parallel_read_safe": True, "parallel_write_safe": True}
@@ -13,8 +13,6 @@
 """
 Helper directive to generate reference in convenient form.
 """
-import arxiv
-
 from docutils import nodes
 from docutils.parsers.rst import Directive
 from sphinx.application import Sphinx
@@ -72,6 +70,7 @@ class Arxiv(Directive):
     final_argument_whitespace = False
 
     def run(self):
+        import arxiv
 
         # search arXiv database
         try:
@@ -103,3 +102,5 @@ class Arxiv(Directive):
 def setup(app: Sphinx):
     app.add_directive("ref_arxiv", Arxiv)
     app.add_directive("ref_website", WebSite)
+
+    return {"parallel_read_safe": True, "parallel_write_safe": True}
@@ -19,6 +19,14 @@ from typing import List
 
 from .utils import _trim_empty_lines
 
+paramdef_regex = re.compile(r"defpar (?P<param>.+):")
+
+description_regexes = {
+    "desc": re.compile(r"desc: (?P<s>.+)"),
+    "init_guess": re.compile(r"init_guess: (?P<s>.+)"),
+    "bounds": re.compile(r"bounds: (?P<s>.+)"),
+}
+
 
 def load_standard_section(docstring_lines: List[str]) -> List[str]:
     """Load standard docstring section."""
@@ -27,15 +35,6 @@ def load_standard_section(docstring_lines: List[str]) -> List[str]:
 
 def load_fit_parameters(docstring_lines: List[str]) -> List[str]:
     """Load fit parameter section."""
-    regex_paramdef = re.compile(r"defpar (?P<param>.+):")
-
-    # item finder
-    description_kind = {
-        "desc": re.compile(r"desc: (?P<s>.+)"),
-        "init_guess": re.compile(r"init_guess: (?P<s>.+)"),
-        "bounds": re.compile(r"bounds: (?P<s>.+)"),
-    }
-
     # parse lines
     parameter_desc = dict()
     current_param = None
@@ -46,7 +45,7 @@ def load_fit_parameters(docstring_lines: List[str]) -> List[str]:
             continue
 
         # check if line is new parameter definition
-        match = re.match(regex_paramdef, line)
+        match = paramdef_regex.match(line)
         if match:
             current_param = match["param"]
             parameter_desc[current_param] = {
@@ -57,8 +56,8 @@ def load_fit_parameters(docstring_lines: List[str]) -> List[str]:
             continue
 
         # check description
-        for kind, regex in description_kind.items():
-            match = re.search(regex, line)
+        for kind, regex in description_regexes.items():
+            match = regex.search(line)
             if match:
                 current_item = kind
                 line = match["s"].rstrip()
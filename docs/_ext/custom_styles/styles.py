@@ -85,7 +85,7 @@ class QiskitExperimentDocstring(ABC):
         temp_lines = list()
         margin = sys.maxsize
         for docstring_line in docstrings:
-            match = re.match(section_regex, docstring_line.strip())
+            match = section_regex.match(docstring_line.strip())
             if match:
                 section_name = match["section_name"]
                 if section_name in self.__sections__:
@@ -23,6 +23,8 @@ from sphinx.util.docstrings import prepare_docstring
 
 from qiskit_experiments.framework import BaseExperiment
 
+param_regex = re.compile(r":(param|type) (?P<pname>\S+):")
+
 
 def _trim_empty_lines(docstring_lines: List[str]) -> List[str]:
     """A helper function to remove redundant line feeds."""
@@ -54,12 +56,11 @@ def _parse_option_field(
     parsed_lines = experiment_option_parser.lines()
 
     # remove redundant descriptions
-    param_regex = re.compile(r":(param|type) (?P<pname>\S+):")
     target_params_description = []
     described_params = set()
     valid_line = False
     for line in parsed_lines:
-        is_item = re.match(param_regex, line)
+        is_item = param_regex.match(line)
         if is_item:
             if is_item["pname"] in target_args:
                 valid_line = True
@@ -0,0 +1,130 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Persistent cache of highlighted code blocks.
+
+Every build highlights all code blocks from scratch although most of them never change.
+This extension stores the Pygments output on disk keyed by the block source, the
+highlighting options and the Pygments and Sphinx versions, so that unchanged blocks are
+not lexed again in later builds. Blocks whose highlighting emits a warning are not
+cached so that the warning is repeated in every build, and entries that were not used
+for ``highlight_cache_max_age`` days are removed.
+"""
+import hashlib
+import logging
+import os
+import time
+
+import pygments
+import sphinx
+from sphinx import highlighting
+from sphinx.application import Sphinx
+from sphinx.highlighting import PygmentsBridge
+
+
+class _WarningRecorder(logging.Filter):
+    """Record whether a warning was logged, without filtering anything."""
+
+    def __init__(self):
+        super().__init__()
+        self.warned = False
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING:
+            self.warned = True
+        return True
+
+
+def _cached_highlight_block(cache_dir: str, highlight_block):
+    """Wrap ``PygmentsBridge.highlight_block`` with a lookup in ``cache_dir``."""
+
+    def _highlight_block(self, source, lang, opts=None, force=False, location=None, **kwargs):
+        if not isinstance(source, str):
+            source = source.decode()
+
+        style = getattr(self.formatter_args.get("style"), "__name__", None)
+        key = repr(
+            (
+                pygments.__version__,
+                sphinx.__version__,
+                self.dest,
+                style,
+                lang,
+                opts,
+                force,
+                sorted(kwargs.items()),
+                source,
+            )
+        )
+        path = os.path.join(cache_dir, hashlib.sha1(key.encode("utf-8")).hexdigest())
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                hlsource = file.read()
+            # mark the entry as used so that it is not pruned
+            os.utime(path)
+            return hlsource
+        except OSError:
+            pass
+
+        recorder = _WarningRecorder()
+        highlighting.logger.logger.addFilter(recorder)
+        try:
+            hlsource = highlight_block(self, source, lang, opts, force, location, **kwargs)
+        finally:
+            highlighting.logger.logger.removeFilter(recorder)
+        if recorder.warned:
+            return hlsource
+
+        # write to a temporary file first so that parallel workers never see partial output
+        tmp_path = f"{path}.{os.getpid()}"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            file.write(hlsource)
+        os.replace(tmp_path, path)
+
+        return hlsource
+
+    return _highlight_block
+
+
+def _prune_cache(cache_dir: str, max_age: float):
+    """Remove the entries of ``cache_dir`` that were not used for ``max_age`` days."""
+    oldest = time.time() - max_age * 86400
+    for entry in os.scandir(cache_dir):
+        try:
+            if entry.stat().st_mtime < oldest:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def setup_cache(app: Sphinx):
+    """Install the cache once the configuration is available."""
+    cache_dir = os.path.join(app.confdir, app.config.highlight_cache_path)
+    os.makedirs(cache_dir, exist_ok=True)
+    _prune_cache(cache_dir, app.config.highlight_cache_max_age)
+
+    # builder-inited fires again for every build in the same process, e.g. with
+    # sphinx-autobuild, so only wrap the original method
+    highlight_block = getattr(
+        PygmentsBridge, "_uncached_highlight_block", PygmentsBridge.highlight_block
+    )
+    PygmentsBridge._uncached_highlight_block = highlight_block
+    PygmentsBridge.highlight_block = _cached_highlight_block(cache_dir, highlight_block)
+
+
+def setup(app: Sphinx):
+    app.add_config_value("highlight_cache_path", os.path.join("_build", ".pygments_cache"), "")
+    app.add_config_value("highlight_cache_max_age", 30, "")
+    app.connect("builder-inited", setup_cache)
+
+    return {"parallel_read_safe": True, "parallel_write_safe": True}
@@ -33,3 +33,5 @@ class JupyterCellCheckEnv(JupyterCell):
 
 def setup(app: Sphinx):
     app.add_directive("jupyter-execute", JupyterCellCheckEnv)
+
+    return {"parallel_read_safe": True, "parallel_write_safe": True}
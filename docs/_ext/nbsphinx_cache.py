@@ -0,0 +1,88 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2022.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""
+Persistent execution cache for the tutorial notebooks rendered by nbsphinx.
+
+Notebooks are executed with :mod:`jupyter_cache` before Sphinx reads them and
+the cached outputs are merged into the notebook source. Unchanged notebooks are
+therefore never executed twice, and nbsphinx (configured with
+``nbsphinx_execute = "auto"``) only runs the notebooks that have no outputs.
+"""
+import os
+
+from sphinx.application import Sphinx
+from sphinx.util import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _notebook_paths(app: Sphinx, docnames):
+    """Return source paths of the notebook documents in ``docnames``."""
+    paths = {}
+    for docname in docnames:
+        path = app.env.doc2path(docname)
+        if path.endswith(".ipynb"):
+            paths[docname] = path
+    return paths
+
+
+def _get_cache(app: Sphinx):
+    """Open the jupyter cache configured for this project."""
+    from jupyter_cache import get_cache
+
+    return get_cache(os.path.join(app.confdir, app.config.nbsphinx_cache_path))
+
+
+def execute_notebooks(app: Sphinx, env, docnames):
+    """Execute outdated notebooks and store the results in the cache."""
+    # pylint: disable=unused-argument
+    from jupyter_cache.executors import load_executor
+
+    paths = _notebook_paths(app, docnames)
+    if not paths:
+        return
+
+    cache = _get_cache(app)
+    for path in paths.values():
+        cache.add_nb_to_project(path)
+
+    executor = load_executor("local-serial", cache=cache)
+    result = executor.run_and_cache(
+        filter_uris=list(paths.values()),
+        timeout=app.config.nbsphinx_timeout,
+    )
+    for uri in result.errored:
+        logger.warning(f"Execution of {uri} failed and is not cached.")
+
+
+def merge_cached_outputs(app: Sphinx, docname: str, source):
+    """Replace the notebook source with its cached executed version."""
+    import nbformat
+
+    path = _notebook_paths(app, [docname]).get(docname)
+    if path is None:
+        return
+
+    try:
+        _, notebook = _get_cache(app).merge_match_into_file(path)
+    except KeyError:
+        return
+    source[0] = nbformat.writes(notebook)
+
+
+def setup(app: Sphinx):
+    app.add_config_value("nbsphinx_cache_path", os.path.join("_build", ".jupyter_cache"), "env")
+    app.connect("env-before-read-docs", execute_notebooks)
+    app.connect("source-read", merge_cached_outputs)
+
+    return {"parallel_read_safe": True, "parallel_write_safe": True}
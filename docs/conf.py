@@ -23,21 +23,20 @@
 # add these directories to sys.path here. If the directory is relative to the
 # documentation root, use os.path.abspath to make it absolute, like shown here.
 #
+import functools
 import os
 import sys
 
 sys.path.insert(0, os.path.abspath("."))
 sys.path.append(os.path.abspath("./_ext"))
 
-"""
-Sphinx documentation builder
-"""
-
-import os
-
 # Set env flag so that we can doc functions that may otherwise not be loaded
 # see for example interactive visualizations in qiskit.visualization.
 os.environ["QISKIT_DOCS"] = "TRUE"
+# Dependencies using the scientific-python lazy_loader import their submodules
+# eagerly, so that import errors surface when autodoc imports a module rather
+# than at an arbitrary attribute access later in the build.
+os.environ.setdefault("EAGER_IMPORT", "1")
 
 # -- Project information -----------------------------------------------------
 project = "Qiskit Experiments"
@@ -49,15 +48,13 @@ version = "0.4"
 # The full version, including alpha/beta/rc tags
 release = "0.4.0"
 
-rst_prolog = """
+rst_prolog = f"""
 .. raw:: html
 
     <br><br><br>
 
-.. |version| replace:: {0}
-""".format(
-    release
-)
+.. |version| replace:: {release}
+"""
 
 nbsphinx_prolog = """
 {% set docname = env.doc2path(env.docname, base=None) %}
@@ -89,27 +86,42 @@ extensions = [
     "sphinx.ext.autodoc",
     "sphinx.ext.autosummary",
     "sphinx.ext.mathjax",
-    "sphinx.ext.viewcode",
+    "sphinx.ext.linkcode",
     "sphinx.ext.extlinks",
-    "jupyter_sphinx",
     "sphinx_autodoc_typehints",
-    "reno.sphinxext",
-    "sphinx_panels",
+    "sphinx_design",
     "sphinx.ext.intersphinx",
-    "nbsphinx",
     "autoref",
     "autodoc_experiment",
     "autodoc_analysis",
-    "jupyter-execute-checkenv",
+    "highlight_cache",
 ]
+# Release notes are skipped with QISKIT_DOCS_SKIP_RELEASENOTES=1, which avoids
+# scanning the git history for reno notes while iterating on the documentation.
+build_release_notes = os.getenv("QISKIT_DOCS_SKIP_RELEASENOTES") != "1"
+if build_release_notes:
+    extensions.append("reno.sphinxext")
 html_static_path = ["_static"]
 templates_path = ["_templates"]
 html_css_files = ["style.css", "custom.css", "gallery.css"]
 
 nbsphinx_timeout = 360
 nbsphinx_execute = os.getenv("QISKIT_DOCS_BUILD_TUTORIALS", "never")
+# Tutorials are not built at all with "skip", which avoids loading the notebook
+# and jupyter cell extensions (and nbconvert, jupyter_client) for API-only builds.
+build_tutorials = nbsphinx_execute != "skip"
+if build_tutorials:
+    extensions += ["jupyter_sphinx", "nbsphinx", "jupyter-execute-checkenv"]
+if nbsphinx_execute == "cache":
+    # Notebooks are executed through a persistent jupyter-cache and nbsphinx
+    # only runs the notebooks that could not be served from the cache.
+    nbsphinx_execute = "auto"
+    nbsphinx_cache_path = os.path.join("_build", ".jupyter_cache")
+    extensions.append("nbsphinx_cache")
 nbsphinx_widgets_path = ""
-exclude_patterns = ["_build", "**.ipynb_checkpoints"]
+# Render figures of executed notebooks at low resolution to keep the executed
+# notebooks and the copied images small.
+nbsphinx_execute_arguments = ["--InlineBackend.rc={'figure.dpi': 72}"]
 nbsphinx_thumbnails = {}
 
 
@@ -118,14 +130,27 @@ nbsphinx_thumbnails = {}
 # -----------------------------------------------------------------------------
 
 autosummary_generate = True
+# Keep existing stub files so that they are only written for new objects. Run
+# ``tox -edocsclean`` to regenerate all stubs, e.g. after changing a template.
+autosummary_generate_overwrite = False
 
 # -----------------------------------------------------------------------------
 # Autodoc
 # -----------------------------------------------------------------------------
 
-autodoc_default_options = {
-    "inherited-members": None,
-}
+# Class templates list the inherited methods explicitly through autosummary,
+# so inherited members are not documented by default.
+autodoc_default_options = {}
+
+# -----------------------------------------------------------------------------
+# Type hints
+# -----------------------------------------------------------------------------
+
+# Render short type names, only document types of parameters that have a
+# description, and never re-import modules with typing.TYPE_CHECKING enabled.
+typehints_fully_qualified = False
+always_document_param_types = False
+set_type_checking_flag = False
 
 
 # If true, figures, tables and code-blocks are automatically numbered if they
@@ -147,9 +172,13 @@ language = None
 # directories to ignore when looking for source files.
 # This pattern also affects html_static_path and html_extra_path.
 exclude_patterns = ["_build", "**.ipynb_checkpoints"]
+if not build_tutorials:
+    exclude_patterns.append("tutorials")
+if not build_release_notes:
+    exclude_patterns.append("release_notes.rst")
 
 # The name of the Pygments (syntax highlighting) style to use.
-pygments_style = "colorful"
+pygments_style = "friendly"
 
 # A boolean that decides whether module names are prepended to all object names
 # (for object types where a “module” of some kind is defined), e.g. for
@@ -185,12 +214,101 @@ html_theme_options = {
 
 
 autoclass_content = 'both'
+# Inventories are read from _intersphinx/ when present, e.g. refreshed by CI, and
+# otherwise downloaded and kept in the build environment for a week.
+intersphinx_cache_limit = 7
 intersphinx_mapping = {
-    'matplotlib': ('https://matplotlib.org/stable/', None),
-    'qiskit': ('https://qiskit.org/documentation/', None),
+    'matplotlib': ('https://matplotlib.org/stable/', ('_intersphinx/matplotlib.inv', None)),
+    'qiskit': ('https://qiskit.org/documentation/', ('_intersphinx/qiskit.inv', None)),
 }
 
 
 # Current scipy hosted docs are missing the object.inv file so leaving this
 # commented out until the missing file is added back.
 #                       'scipy': ('https://docs.scipy.org/doc/scipy/reference/', None)}
+
+
+# -----------------------------------------------------------------------------
+# Source links
+# -----------------------------------------------------------------------------
+
+# Objects link to their source on GitHub instead of pages generated by viewcode.
+repository_url = "https://github.com/Qiskit/qiskit-experiments"
+repository_root = os.path.abspath("..")
+
+
+@functools.lru_cache(maxsize=None)
+def _source_revision():
+    """Return the git revision that the source links point to."""
+    import subprocess
+
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], cwd=repository_root, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "main"
+
+
+@functools.lru_cache(maxsize=None)
+def _source_link(module, fullname):
+    """Return the GitHub URL of the source lines of an object."""
+    import importlib
+    import inspect
+
+    try:
+        obj = importlib.import_module(module)
+        for name in fullname.split("."):
+            obj = getattr(obj, name)
+        obj = inspect.unwrap(getattr(obj, "fget", obj))
+        filename = inspect.getsourcefile(obj)
+        lines, lineno = inspect.getsourcelines(obj)
+    except (AttributeError, ImportError, OSError, TypeError):
+        return None
+    if filename is None:
+        return None
+
+    path = os.path.relpath(filename, repository_root)
+    if path.startswith(".."):
+        # Object is defined outside of this repository
+        return None
+    lastline = lineno + len(lines) - 1
+    return f"{repository_url}/blob/{_source_revision()}/{path}#L{lineno}-L{lastline}"
+
+
+def linkcode_resolve(domain, info):
+    """Resolve the source link of a documented object for sphinx.ext.linkcode."""
+    if domain != "py" or not info["module"]:
+        return None
+    return _source_link(info["module"], info["fullname"])
+
+
+# -----------------------------------------------------------------------------
+# Parallel build
+# -----------------------------------------------------------------------------
+
+# Minimum number of documents handed to a single worker process under
+# ``sphinx-build -j``. Sphinx defaults to very small batches which makes the
+# pickling and merging of environments dominate for the large number of
+# autosummary stubs generated by the API reference.
+parallel_min_batch = 200
+
+
+def _make_chunks(arguments, nproc, maxbatch=10):
+    """Partition documents into large chunks for parallel read and write."""
+    # pylint: disable=unused-argument
+    chunksize = max(parallel_min_batch, len(arguments) // (nproc * 2))
+    return [arguments[i : i + chunksize] for i in range(0, len(arguments), chunksize)]
+
+
+def setup(app):
+    """Project specific setup of the Sphinx application."""
+    # pylint: disable=unused-argument
+    from sphinx import builders
+    from sphinx.util import parallel
+
+    # Builders import ``make_chunks`` by name, so both references are replaced.
+    parallel.make_chunks = _make_chunks
+    builders.make_chunks = _make_chunks
+
+    return {"parallel_read_safe": True, "parallel_write_safe": True}
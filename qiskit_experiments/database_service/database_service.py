@@ -385,6 +385,19 @@ class DatabaseServiceV1(DatabaseService, ABC):
         """
         pass
 
+    @property
+    def supports_compressed_figures(self) -> bool:
+        """Return whether the service accepts figures compressed by ``qiskit_experiments``.
+
+        A service that returns ``True`` stores figures uploaded with the
+        compression prefix as they are and returns them unchanged, so that
+        they can be decompressed when retrieved.
+
+        Returns:
+            Whether compressed figures are supported. The default is ``False``.
+        """
+        return False
+
     @property
     @abstractmethod
     def preferences(self) -> Dict:
@@ -12,12 +12,15 @@
 
 """Stored data class."""
 
+import hashlib
+import json
 import warnings
 import logging
 import dataclasses
 import uuid
 import enum
 import time
+import pickle
 from typing import Optional, List, Any, Union, Callable, Dict, Tuple
 import copy
 from concurrent import futures
@@ -25,8 +28,6 @@ from threading import Event
 from functools import wraps
 import traceback
 import contextlib
-from collections import deque
-import numpy as np
 
 from matplotlib import pyplot
 from qiskit import QiskitError
@@ -42,6 +43,10 @@ from .utils import (
     save_data,
     qiskit_version,
     plot_to_svg_bytes,
+    write_plot_svg,
+    compress_figure,
+    decompress_figure,
+    ENTRY_NOT_FOUND_ERRORS,
     ThreadSafeOrderedDict,
     ThreadSafeList,
 )
@@ -55,20 +60,35 @@ def do_auto_save(func: Callable):
     @wraps(func)
     def _wrapped(self, *args, **kwargs):
         return_val = func(self, *args, **kwargs)
-        if self.auto_save:
-            self.save_metadata()
+        if self.auto_save and self._metadata_modified():
+            self._save_metadata_or_defer()
         return return_val
 
     return _wrapped
 
 
+def _fast_copy(metadata: Dict) -> Dict:
+    """Return a deep copy of a metadata dictionary.
+
+    Flat dictionaries of scalars are copied directly and other values are
+    round-tripped through pickle, which is much faster than ``copy.deepcopy``.
+    ``copy.deepcopy`` is only used for values that cannot be pickled.
+    """
+    if all(isinstance(value, (str, int, float, bool, type(None))) for value in metadata.values()):
+        return dict(metadata)
+    try:
+        return pickle.loads(pickle.dumps(metadata, protocol=pickle.HIGHEST_PROTOCOL))
+    except Exception:  # pylint: disable=broad-except
+        return copy.deepcopy(metadata)
+
+
 @contextlib.contextmanager
 def service_exception_to_warning():
     """Convert an exception raised by experiment service to a warning."""
     try:
         yield
     except Exception:  # pylint: disable=broad-except
-        LOG.warning("Experiment service operation failed: %s", traceback.format_exc())
+        LOG.warning("Experiment service operation failed.", exc_info=True)
 
 
 class ExperimentStatus(enum.Enum):
@@ -154,10 +174,43 @@ class DbExperimentDataV1(DbExperimentData):
     version = 1
     verbose = True  # Whether to print messages to the standard output.
     _metadata_version = 1
-    _job_executor = futures.ThreadPoolExecutor()
+    _figure_compression_threshold = 4096
+    # Seconds for which a figure missing from the service is not requested again
+    _missing_figure_ttl = 60
+    # Job data futures block on ``job.result()`` while the add_jobs timeout
+    # futures wait on those data futures. Keeping them in separate pools
+    # ensures timeout futures can never occupy every worker needed by the
+    # futures they are waiting for. Monitor tasks must not submit work that
+    # depends on other monitor tasks.
+    _job_wait_executor = futures.ThreadPoolExecutor(max_workers=64, thread_name_prefix="job-wait")
+    _job_monitor_executor = futures.ThreadPoolExecutor(thread_name_prefix="job-monitor")
+    # Service calls issued concurrently by ``add_figures`` and ``save``. HTTP
+    # based services typically keep 10 pooled connections per host (the
+    # requests/urllib3 default), so more workers would open connections that
+    # are discarded after a single call instead of being reused.
+    _service_executor = futures.ThreadPoolExecutor(
+        max_workers=10, thread_name_prefix="experiment-service"
+    )
 
     _json_encoder = ExperimentEncoder
     _json_decoder = ExperimentDecoder
+    _default_source = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Each subclass records its own class name, so never reuse the parent's template.
+        cls._default_source = None
+
+    @classmethod
+    def _get_default_source(cls) -> Dict:
+        """Return the source template shared by all instances of this class."""
+        if cls._default_source is None:
+            cls._default_source = {
+                "class": f"{cls.__module__}.{cls.__name__}",
+                "metadata_version": cls._metadata_version,
+                "qiskit_version": qiskit_version(),
+            }
+        return cls._default_source
 
     def __init__(
         self,
@@ -192,15 +245,13 @@ class DbExperimentDataV1(DbExperimentData):
             **kwargs: Additional experiment attributes.
         """
         metadata = metadata or {}
-        self._metadata = copy.deepcopy(metadata)
-        self._source = self._metadata.pop(
-            "_source",
-            {
-                "class": f"{self.__class__.__module__}.{self.__class__.__name__}",
-                "metadata_version": self._metadata_version,
-                "qiskit_version": qiskit_version(),
-            },
-        )
+        self._metadata = _fast_copy(metadata)
+        if "_source" in self._metadata:
+            self._source = self._metadata.pop("_source")
+        else:
+            self._source = self._get_default_source().copy()
+
+        self._init_transient_state()
 
         self._service = service
         if self.service is None:
@@ -216,37 +267,114 @@ class DbExperimentDataV1(DbExperimentData):
         self._notes = notes or ""
 
         self._jobs = ThreadSafeOrderedDict(job_ids or [])
-        self._job_futures = ThreadSafeOrderedDict()
         self._analysis_callbacks = ThreadSafeOrderedDict()
-        self._analysis_futures = ThreadSafeOrderedDict()
         # Set 2 workers for analysis executor so there can be 1 actively running
         # future and one waiting "running" future. This is to allow the second
         # future to be cancelled without waiting for the actively running future
         # to finish first.
         self._analysis_executor = futures.ThreadPoolExecutor(max_workers=2)
-        self._monitor_executor = futures.ThreadPoolExecutor()
 
         self._data = ThreadSafeList()
         self._figures = ThreadSafeOrderedDict(figure_names or [])
         self._analysis_results = ThreadSafeOrderedDict()
+        # Whether the analysis results were retrieved from the service
+        self._analysis_results_loaded = False
 
-        self._deleted_figures = deque()
-        self._deleted_analysis_results = deque()
+        # Entries to delete from the service on the next save. Dicts are used
+        # as insertion ordered sets.
+        self._deleted_figures = {}
+        self._deleted_analysis_results = {}
+
+        # Digest of the experiment fields last saved by save_metadata
+        self._saved_metadata_fingerprint = None
 
         self._created_in_db = False
         self._extra_data = kwargs
 
+    def _init_transient_state(self) -> None:
+        """Initialize the futures, caches and pending saves.
+
+        These attributes are not serialized. This is called on creation and
+        when unpickling, which also covers objects pickled by older versions.
+        """
+        # Preferences of the service they were fetched from
+        self._service_preferences = (None, {})
+
+        # Statuses of jobs that reached a final state, which cannot change
+        self._final_job_statuses = {}
+        self._job_futures = ThreadSafeOrderedDict()
+        # Number of job futures that are not done, guarded by the job futures lock
+        self._unfinished_jobs = 0
+        self._analysis_futures = ThreadSafeOrderedDict()
+        # Number of analysis futures that are not done, guarded by the analysis futures lock
+        self._unfinished_analysis = 0
+
+        # Data entries indexed by job ID, see _data_for_job
+        self._data_by_job = {}
+        self._data_by_job_state = (None, 0, None)
+        # Rendered SVG of matplotlib figures by name, see _figure_svg
+        self._figure_svg_cache = {}
+        # Time at which the service last reported a figure as missing, and the
+        # type and arguments of the error it raised
+        self._missing_figures = {}
+        # Analysis results indexed by name, see _results_for_name
+        self._results_by_name = (None, {})
+
+        # Saves deferred by batch_saves
+        self._batch_depth = 0
+        self._dirty_metadata = False
+        self._dirty_all = False
+        self._pending_figure_writes = []
+        self._pending_result_writes = []
+
     def _clear_results(self):
         """Delete all currently stored analysis results and figures"""
         # Schedule existing analysis results for deletion next save call
-        for key in self._analysis_results.keys():
-            self._deleted_analysis_results.append(key)
+        self._deleted_analysis_results.update(dict.fromkeys(self._analysis_results.keys()))
         self._analysis_results = ThreadSafeOrderedDict()
         # Schedule existing figures for deletion next save call
-        for key in self._figures.keys():
-            self._deleted_figures.append(key)
+        self._deleted_figures.update(dict.fromkeys(self._figures.keys()))
         self._figures = ThreadSafeOrderedDict()
 
+    def _metadata_modified(self) -> bool:
+        """Return whether the experiment metadata in the database may be out of date."""
+        if not self._created_in_db:
+            return True
+        fingerprint = self._metadata_fingerprint()
+        return fingerprint is None or fingerprint != self._saved_metadata_fingerprint
+
+    def _metadata_fingerprint(self) -> Optional[str]:
+        """Return a digest of the experiment fields saved by :meth:`save_metadata`.
+
+        The fields are compared by value because the metadata and tags can be
+        modified in place through their properties. ``None`` is returned if the
+        fields cannot be encoded.
+        """
+        try:
+            encoded = json.dumps(self._metadata_update_data(), cls=self._json_encoder)
+        except Exception:  # pylint: disable=broad-except
+            return None
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def _metadata_update_data(self) -> Dict[str, Any]:
+        """Return the experiment fields sent to the service when the metadata is saved."""
+        # Only the top level is copied to add the source. The service encodes
+        # the metadata and does not modify it.
+        metadata = {**self._metadata, "_source": self._source}
+
+        update_data = {
+            "experiment_id": self._id,
+            "metadata": metadata,
+            "job_ids": self.job_ids,
+            "tags": self.tags,
+            "notes": self.notes,
+        }
+        if self.share_level:
+            update_data["share_level"] = self.share_level
+        if self.parent_id:
+            update_data["parent_id"] = self.parent_id
+        return update_data
+
     def _set_service_from_backend(self, backend: Backend) -> None:
         """Set the service to be used from the input backend.
 
@@ -255,7 +383,19 @@ class DbExperimentDataV1(DbExperimentData):
         """
         with contextlib.suppress(Exception):
             self._service = backend.provider().service("experiment")
-            self._auto_save = self._service.preferences.get("auto_save", False)
+            self._auto_save = self._get_service_preference("auto_save", False)
+
+    def _get_service_preference(self, key: str, default: Any = None) -> Any:
+        """Return a preference of the current service.
+
+        The preferences are fetched once per service since services may
+        request them from a remote server each time they are accessed.
+        """
+        service, preferences = self._service_preferences
+        if service is not self._service:
+            preferences = self._service.preferences
+            self._service_preferences = (self._service, preferences)
+        return preferences.get(key, default)
 
     def add_data(
         self,
@@ -277,7 +417,7 @@ class DbExperimentDataV1(DbExperimentData):
         Raises:
             TypeError: If the input data type is invalid.
         """
-        if any(not future.done() for future in self._analysis_futures.values()):
+        if self._unfinished_analysis:
             LOG.warning(
                 "Not all analysis has finished running. Adding new data may "
                 "create unexpected analysis results."
@@ -288,15 +428,21 @@ class DbExperimentDataV1(DbExperimentData):
         # Extract job data (Deprecated) and directly add non-job data
         jobs = []
         with self._data.lock:
+            # Consecutive dicts are added together to avoid locking per item
+            dicts = []
             for datum in data:
                 if isinstance(datum, Job):
                     jobs.append(datum)
                 elif isinstance(datum, dict):
-                    self._data.append(datum)
+                    dicts.append(datum)
                 elif isinstance(datum, Result):
+                    self._data.extend(dicts)
+                    dicts = []
                     self._add_result_data(datum)
                 else:
+                    self._data.extend(dicts)
                     raise TypeError(f"Invalid data type {type(datum)}.")
+            self._data.extend(dicts)
 
         # Remove after deprecation is finished
         if jobs:
@@ -339,7 +485,7 @@ class DbExperimentDataV1(DbExperimentData):
             If you want to wait for jobs without cancelling, use the timeout
             kwarg of :meth:`block_for_results` instead.
         """
-        if any(not future.done() for future in self._analysis_futures.values()):
+        if self._unfinished_analysis:
             LOG.warning(
                 "Not all analysis has finished running. Adding new jobs may "
                 "create unexpected analysis results."
@@ -347,42 +493,58 @@ class DbExperimentDataV1(DbExperimentData):
         if isinstance(jobs, Job):
             jobs = [jobs]
 
-        # Add futures for extracting finished job data
-        timeout_ids = []
+        # Resolve the job backends before taking the jobs lock, since
+        # these can be calls to the provider
+        backend_name = self._backend.name() if self._backend else None
         for job in jobs:
-            jid = job.job_id()
-            if self.backend and self.backend.name() != job.backend().name():
+            job_backend = job.backend()
+            job_backend_name = job_backend.name()
+            if backend_name is not None and backend_name != job_backend_name:
                 LOG.warning(
                     "Adding a job from a backend (%s) that is different "
                     "than the current backend (%s). "
                     "The new backend will be used, but "
                     "service is not changed if one already exists.",
-                    job.backend(),
-                    self.backend,
+                    job_backend,
+                    self._backend,
                 )
-            self._backend = job.backend()
-            if not self._service:
-                self._set_service_from_backend(self._backend)
+            self._backend = job_backend
+            backend_name = job_backend_name
 
-            if jid in self._jobs:
-                LOG.warning(
-                    "Skipping duplicate job, a job with this ID already exists [Job ID: %s]", jid
-                )
-            else:
-                self._jobs[jid] = job
-                if jid in self._job_futures:
-                    LOG.warning("Job future has already been submitted [Job ID: %s]", jid)
+        # Collect the new jobs, checking for duplicates against a single
+        # snapshot of the existing job IDs
+        job_ids = [job.job_id() for job in jobs]
+        new_jobs = {}
+        with self._jobs.lock:
+            existing_ids = set(self._jobs.keys())
+            for jid, job in zip(job_ids, jobs):
+                if jid in existing_ids or jid in new_jobs:
+                    LOG.warning(
+                        "Skipping duplicate job, a job with this ID already exists [Job ID: %s]",
+                        jid,
+                    )
                 else:
-                    self._add_job_future(job)
-                    if timeout is not None:
-                        timeout_ids.append(jid)
+                    new_jobs[jid] = job
+            self._jobs.update(new_jobs)
+        if jobs and not self._service:
+            self._set_service_from_backend(self._backend)
+
+        # Add futures for extracting finished job data
+        timeout_ids = []
+        for jid, job in new_jobs.items():
+            if jid in self._job_futures:
+                LOG.warning("Job future has already been submitted [Job ID: %s]", jid)
+            else:
+                self._add_job_future(job)
+                if timeout is not None:
+                    timeout_ids.append(jid)
 
         # Add future for cancelling jobs that timeout
         if timeout_ids:
-            self._job_executor.submit(self._timeout_running_jobs, timeout_ids, timeout)
+            self._job_monitor_executor.submit(self._timeout_running_jobs, timeout_ids, timeout)
 
         if self.auto_save:
-            self.save_metadata()
+            self._save_metadata_or_defer()
 
     def _timeout_running_jobs(self, job_ids, timeout):
         """Function for cancelling jobs after timeout length.
@@ -396,11 +558,11 @@ class DbExperimentDataV1(DbExperimentData):
         futs = [self._job_futures[jid] for jid in job_ids]
         waited = futures.wait(futs, timeout=timeout)
 
-        # Try to cancel timed-out jobs
+        # Try to cancel timed-out jobs. Match futures by identity rather than
+        # by their results, which raise for failed or cancelled jobs.
         if waited.not_done:
             LOG.debug("Cancelling running jobs that exceeded add_jobs timeout.")
-            done_ids = {fut.result()[0] for fut in waited.done}
-            notdone_ids = [jid for jid in job_ids if jid not in done_ids]
+            notdone_ids = [jid for jid, fut in zip(job_ids, futs) if fut in waited.not_done]
             self.cancel_jobs(notdone_ids)
 
     def _add_job_future(self, job):
@@ -409,7 +571,16 @@ class DbExperimentDataV1(DbExperimentData):
         if jid in self._job_futures:
             LOG.warning("Job future has already been submitted [Job ID: %s]", jid)
         else:
-            self._job_futures[jid] = self._job_executor.submit(self._add_job_data, job)
+            job_future = self._job_wait_executor.submit(self._add_job_data, job)
+            with self._job_futures.lock:
+                self._job_futures[jid] = job_future
+                self._unfinished_jobs += 1
+            job_future.add_done_callback(self._job_finished)
+
+    def _job_finished(self, _: futures.Future) -> None:
+        """Update the unfinished job count when a job future finishes."""
+        with self._job_futures.lock:
+            self._unfinished_jobs -= 1
 
     def _add_job_data(
         self,
@@ -434,7 +605,7 @@ class DbExperimentDataV1(DbExperimentData):
             return jid, True
         except Exception as ex:  # pylint: disable=broad-except
             # Handle cancelled jobs
-            status = job.status()
+            status = self._get_job_status(jid, job)
             if status == JobStatus.CANCELLED:
                 LOG.warning("Job was cancelled before completion [Job ID: %s]", jid)
                 return jid, False
@@ -465,7 +636,9 @@ class DbExperimentDataV1(DbExperimentData):
                       keywork arguments passed to this method.
             **kwargs: Keyword arguments to be passed to the callback function.
         """
-        with self._job_futures.lock and self._analysis_futures.lock:
+        # Lock job and analysis futures, always in this order, so that the
+        # futures this callback waits for cannot change while it is queued
+        with self._job_futures.lock, self._analysis_futures.lock:
             # Create callback dataclass
             cid = uuid.uuid4().hex
             self._analysis_callbacks[cid] = AnalysisCallback(
@@ -475,27 +648,24 @@ class DbExperimentDataV1(DbExperimentData):
 
             # Futures to wait for
             futs = self._job_futures.values() + self._analysis_futures.values()
-            wait_future = self._monitor_executor.submit(
-                self._wait_for_futures, futs, name="jobs and analysis"
-            )
-
-            # Create a future to monitor event for calls to cancel_analysis
-            def _monitor_cancel():
-                self._analysis_callbacks[cid].event.wait()
-                return False
-
-            cancel_future = self._monitor_executor.submit(_monitor_cancel)
 
             # Add run analysis future
-            self._analysis_futures[cid] = self._analysis_executor.submit(
-                self._run_analysis_callback, cid, wait_future, cancel_future, callback, **kwargs
+            analysis_future = self._analysis_executor.submit(
+                self._run_analysis_callback, cid, futs, callback, **kwargs
             )
+            self._analysis_futures[cid] = analysis_future
+            self._unfinished_analysis += 1
+            analysis_future.add_done_callback(self._analysis_finished)
+
+    def _analysis_finished(self, _: futures.Future) -> None:
+        """Update the unfinished analysis count when an analysis future finishes."""
+        with self._analysis_futures.lock:
+            self._unfinished_analysis -= 1
 
     def _run_analysis_callback(
         self,
         callback_id: str,
-        wait_future: futures.Future,
-        cancel_future: futures.Future,
+        futs: List[futures.Future],
         callback: Callable,
         **kwargs,
     ):
@@ -504,13 +674,26 @@ class DbExperimentDataV1(DbExperimentData):
             raise ValueError(f"No analysis callback with id {callback_id}")
 
         # Monitor jobs and cancellation event to see if callback should be run
-        # or cancelled
-        # Future which returns if either all jobs finish, or cancel event is set
-        waited = futures.wait([wait_future, cancel_future], return_when="FIRST_COMPLETED")
-        cancel = not all(fut.result() for fut in waited.done)
-
-        # Ensure monitor event is set so monitor future can terminate
-        self._analysis_callbacks[callback_id].event.set()
+        # or cancelled. The event is set either by cancel_analysis, which marks
+        # the callback as cancelled first, or by the done callback of the last
+        # future to finish, so no extra threads are needed to wait for the futures.
+        event = self._analysis_callbacks[callback_id].event
+
+        def _set_if_all_done(_=None):
+            if all(fut.done() for fut in futs):
+                event.set()
+
+        for fut in futs:
+            fut.add_done_callback(_set_if_all_done)
+        _set_if_all_done()
+        event.wait()
+
+        if self._analysis_callbacks[callback_id].status == AnalysisStatus.CANCELLED:
+            cancel = True
+        elif all(fut.done() for fut in futs):
+            cancel = not self._wait_for_futures(futs, name="jobs and analysis")
+        else:
+            cancel = True
 
         # If not ready cancel the callback before running
         if cancel:
@@ -556,24 +739,27 @@ class DbExperimentDataV1(DbExperimentData):
         Args:
             result: Result object containing data to be added.
         """
-        if result.job_id not in self._jobs:
-            self._jobs[result.job_id] = None
-        with self._data.lock:
-            # Lock data while adding all result data
-            for i, _ in enumerate(result.results):
-                data = result.data(i)
-                data["job_id"] = result.job_id
-                if "counts" in data:
-                    # Format to Counts object rather than hex dict
-                    data["counts"] = result.get_counts(i)
-                expr_result = result.results[i]
-                if hasattr(expr_result, "header") and hasattr(expr_result.header, "metadata"):
-                    data["metadata"] = expr_result.header.metadata
-                data["shots"] = expr_result.shots
-                data["meas_level"] = expr_result.meas_level
-                if hasattr(expr_result, "meas_return"):
-                    data["meas_return"] = expr_result.meas_return
-                self._data.append(data)
+        job_id = result.job_id
+        if job_id not in self._jobs:
+            self._jobs[job_id] = None
+
+        # Build all entries first so the data lock is only taken once
+        batch = []
+        for i, expr_result in enumerate(result.results):
+            data = expr_result.data.to_dict()
+            data["job_id"] = job_id
+            if "counts" in data:
+                # Format to Counts object rather than hex dict
+                data["counts"] = result.get_counts(i)
+            header = getattr(expr_result, "header", None)
+            if hasattr(header, "metadata"):
+                data["metadata"] = header.metadata
+            data["shots"] = expr_result.shots
+            data["meas_level"] = expr_result.meas_level
+            if hasattr(expr_result, "meas_return"):
+                data["meas_return"] = expr_result.meas_return
+            batch.append(data)
+        self._data.extend(batch)
 
     def _retrieve_data(self):
         """Retrieve job data if missing experiment data."""
@@ -630,9 +816,32 @@ class DbExperimentDataV1(DbExperimentData):
         if isinstance(index, (int, slice)):
             return self._data[index]
         if isinstance(index, str):
-            return [data for data in self._data if data.get("job_id") == index]
+            return self._data_for_job(index)
         raise TypeError(f"Invalid index type {type(index)}.")
 
+    def _data_for_job(self, job_id: str) -> List[Dict]:
+        """Return the data entries produced by a job.
+
+        Entries are indexed by job ID as they are first looked up, so only data
+        added since the previous call needs to be scanned. The index is rebuilt
+        if the data container was replaced or cleared in the meantime.
+        """
+        with self._data.lock:
+            container, num_indexed, last_entry = self._data_by_job_state
+            if (
+                container is not self._data
+                or num_indexed > len(self._data)
+                or (num_indexed and self._data[num_indexed - 1] is not last_entry)
+            ):
+                self._data_by_job = {}
+                num_indexed = 0
+            if num_indexed < len(self._data):
+                for datum in self._data[num_indexed:]:
+                    self._data_by_job.setdefault(datum.get("job_id"), []).append(datum)
+                num_indexed = len(self._data)
+                self._data_by_job_state = (self._data, num_indexed, self._data[num_indexed - 1])
+            return list(self._data_by_job.get(job_id, []))
+
     @do_auto_save
     def add_figures(
         self,
@@ -674,6 +883,7 @@ class DbExperimentDataV1(DbExperimentData):
             )
 
         added_figs = []
+        uploads = []
         for idx, figure in enumerate(figures):
             if figure_names is None:
                 if isinstance(figure, str):
@@ -706,23 +916,17 @@ class DbExperimentDataV1(DbExperimentData):
             self._figures[fig_name] = figure
 
             save = save_figure if save_figure is not None else self.auto_save
-            if save and self._service:
-                if isinstance(figure, pyplot.Figure):
-                    figure = plot_to_svg_bytes(figure)
-                data = {
-                    "experiment_id": self.experiment_id,
-                    "figure": figure,
-                    "figure_name": fig_name,
-                }
-                save_data(
-                    is_new=(not existing_figure),
-                    new_func=self._service.create_figure,
-                    update_func=self._service.update_figure,
-                    new_data={},
-                    update_data=data,
+            if save and self._service and self._batch_depth:
+                self._pending_figure_writes.append((not existing_figure, fig_name))
+            elif save and self._service:
+                uploads.append(
+                    self._submit_figure_save(
+                        self._service_executor, not existing_figure, fig_name, figure
+                    )
                 )
             added_figs.append(fig_name)
 
+        futures.wait(uploads)
         return added_figs if len(added_figs) != 1 else added_figs[0]
 
     @do_auto_save
@@ -742,20 +946,83 @@ class DbExperimentDataV1(DbExperimentData):
             DbExperimentEntryNotFound: If the figure is not found.
         """
         if isinstance(figure_key, int):
-            figure_key = self._figures.keys()[figure_key]
+            figure_key = self._figures.key_at(figure_key)
         elif figure_key not in self._figures:
             raise DbExperimentEntryNotFound(f"Figure {figure_key} not found.")
 
         del self._figures[figure_key]
-        self._deleted_figures.append(figure_key)
+        self._figure_svg_cache.pop(figure_key, None)
+        self._deleted_figures[figure_key] = None
 
-        if self._service and self.auto_save:
+        if self._service and self.auto_save and not self._batch_depth:
             with service_exception_to_warning():
                 self.service.delete_figure(experiment_id=self.experiment_id, figure_name=figure_key)
-            self._deleted_figures.remove(figure_key)
+            self._deleted_figures.pop(figure_key, None)
 
         return figure_key
 
+    def _figure_svg(self, name: str, figure: Union[bytes, pyplot.Figure]) -> bytes:
+        """Return the SVG of a matplotlib figure, reusing the last rendering if possible.
+
+        Rendering is reused only for figures not managed by pyplot, when the
+        figure has not changed since. Matplotlib marks a figure stale whenever
+        one of its artists is modified, so the figure is marked as not stale
+        after it was rendered. Other figure data is returned unchanged.
+        """
+        if not isinstance(figure, pyplot.Figure):
+            return figure
+        cached = self._figure_svg_cache.get(name)
+        if cached is not None and cached[0] is figure and not figure.stale:
+            return cached[1]
+        svg = plot_to_svg_bytes(figure)
+        if figure.canvas.manager is None:
+            figure.stale = False
+            self._figure_svg_cache[name] = (figure, svg)
+        return svg
+
+    def _figure_upload_data(self, figure: Union[bytes, pyplot.Figure]) -> bytes:
+        """Return the figure data to send to the database service.
+
+        Matplotlib figures are converted to SVG. Figures larger than
+        ``_figure_compression_threshold`` bytes are compressed if the service
+        supports compressed figures.
+        """
+        if isinstance(figure, pyplot.Figure):
+            figure = plot_to_svg_bytes(figure)
+        compress = getattr(self._service, "supports_compressed_figures", False) is True
+        threshold = self._figure_compression_threshold
+        if compress and isinstance(figure, bytes) and len(figure) > threshold:
+            figure = compress_figure(figure)
+        return figure
+
+    def _submit_figure_save(
+        self,
+        executor: futures.Executor,
+        is_new: bool,
+        name: str,
+        figure: Union[bytes, pyplot.Figure],
+    ) -> futures.Future:
+        """Convert a figure and submit saving it to the database service.
+
+        The figure is converted in the calling thread, since matplotlib is not
+        thread safe, and only the upload runs in ``executor``. When several
+        figures are saved the upload of one figure overlaps with the conversion
+        of the next one.
+        """
+        data = {
+            "experiment_id": self.experiment_id,
+            "figure": self._figure_upload_data(self._figure_svg(name, figure)),
+            "figure_name": name,
+        }
+        return executor.submit(
+            save_data,
+            is_new=is_new,
+            new_func=self._service.create_figure,
+            update_func=self._service.update_figure,
+            new_data={},
+            update_data=data,
+        )
+
     def figure(
         self,
         figure_key: Union[str, int],
@@ -773,23 +1040,46 @@ class DbExperimentDataV1(DbExperimentData):
             content of the figure in bytes.
 
         Raises:
-            DbExperimentEntryNotFound: If the figure cannot be found.
+            DbExperimentEntryNotFound: If the figure cannot be found. Errors raised
+                by the service for a missing figure are passed through unchanged.
         """
         if isinstance(figure_key, int):
-            figure_key = self._figures.keys()[figure_key]
+            figure_key = self._figures.key_at(figure_key)
 
         figure_data = self._figures.get(figure_key, None)
         if figure_data is None and self.service:
-            figure_data = self.service.figure(
-                experiment_id=self.experiment_id, figure_name=figure_key
-            )
-            self._figures[figure_key] = figure_data
+            missing_since, error = self._missing_figures.get(figure_key, (None, None))
+            if missing_since is None or time.monotonic() - missing_since > self._missing_figure_ttl:
+                try:
+                    figure_data = decompress_figure(
+                        self.service.figure(
+                            experiment_id=self.experiment_id, figure_name=figure_key
+                        )
+                    )
+                except ENTRY_NOT_FOUND_ERRORS as ex:
+                    # Keep the error type and arguments rather than the instance,
+                    # which references the frames of this call
+                    self._missing_figures[figure_key] = (time.monotonic(), (type(ex), ex.args))
+                    raise
+                if figure_data is None:
+                    self._missing_figures[figure_key] = (time.monotonic(), None)
+                else:
+                    self._missing_figures.pop(figure_key, None)
+                    self._figures[figure_key] = figure_data
+            elif error is not None:
+                # Raise a new instance of the error the service reported
+                error_type, error_args = error
+                raise error_type(*error_args)
 
         if figure_data is None:
             raise DbExperimentEntryNotFound(f"Figure {figure_key} not found.")
 
         if file_name:
             with open(file_name, "wb") as output:
+                if isinstance(figure_data, pyplot.Figure):
+                    # Render straight to the file instead of into memory first
+                    write_plot_svg(figure_data, output)
+                    return output.tell()
                 num_bytes = output.write(figure_data)
                 return num_bytes
         return figure_data
@@ -808,14 +1098,19 @@ class DbExperimentDataV1(DbExperimentData):
             results = [results]
 
         for result in results:
-            self._analysis_results[result.result_id] = result
+            with self._analysis_results.lock:
+                self._analysis_results[result.result_id] = result
+                self._results_by_name = (None, {})
 
             with contextlib.suppress(DbExperimentDataError):
                 result.service = self.service
                 result.auto_save = self.auto_save
 
             if self.auto_save and self._service:
-                result.save()
+                if self._batch_depth:
+                    self._pending_result_writes.append(result)
+                else:
+                    result.save()
 
     @do_auto_save
     def delete_analysis_result(
@@ -835,18 +1130,20 @@ class DbExperimentDataV1(DbExperimentData):
         """
 
         if isinstance(result_key, int):
-            result_key = self._analysis_results.keys()[result_key]
+            result_key = self._analysis_results.key_at(result_key)
         else:
             # Retrieve from DB if needed.
             result_key = self.analysis_results(result_key, block=False).result_id
 
-        del self._analysis_results[result_key]
-        self._deleted_analysis_results.append(result_key)
+        with self._analysis_results.lock:
+            del self._analysis_results[result_key]
+            self._results_by_name = (None, {})
+        self._deleted_analysis_results[result_key] = None
 
-        if self._service and self.auto_save:
+        if self._service and self.auto_save and not self._batch_depth:
             with service_exception_to_warning():
                 self.service.delete_analysis_result(result_id=result_key)
-            self._deleted_analysis_results.remove(result_key)
+            self._deleted_analysis_results.pop(result_key, None)
 
         return result_key
 
@@ -857,14 +1154,23 @@ class DbExperimentDataV1(DbExperimentData):
             refresh: Retrieve the latest analysis results from the server, if
                 an experiment service is available.
         """
-        # Get job results if missing experiment data.
-        if self.service and (not self._analysis_results or refresh):
+        # Get analysis results if they were not retrieved or added yet
+        loaded = self._analysis_results_loaded or self._analysis_results
+        if self.service and (refresh or not loaded):
             retrieved_results = self.service.analysis_results(
                 experiment_id=self.experiment_id, limit=None, json_decoder=self._json_decoder
             )
-            for result in retrieved_results:
-                result_id = result["result_id"]
-                self._analysis_results[result_id] = DbAnalysisResult._from_service_data(result)
+            # Convert the results before taking the lock so readers are not
+            # blocked while the service data is decoded
+            results = {
+                result["result_id"]: DbAnalysisResult._from_service_data(result)
+                for result in retrieved_results
+            }
+            with self._analysis_results.lock:
+                self._analysis_results.update(results)
+                self._results_by_name = (None, {})
+            # An experiment without results is not queried again
+            self._analysis_results_loaded = True
 
     def analysis_results(
         self,
@@ -912,11 +1218,14 @@ class DbExperimentDataV1(DbExperimentData):
             return "\n".join(msg)
 
         if isinstance(index, int):
-            if index >= len(self._analysis_results.values()):
-                raise DbExperimentEntryNotFound(_make_not_found_message(index))
-            return self._analysis_results.values()[index]
+            try:
+                return self._analysis_results.value_at(index)
+            except IndexError:
+                if index < 0:
+                    raise
+                raise DbExperimentEntryNotFound(_make_not_found_message(index)) from None
         if isinstance(index, slice):
-            results = self._analysis_results.values()[index]
+            results = self._analysis_results.slice_values(index)
             if not results:
                 raise DbExperimentEntryNotFound(_make_not_found_message(index))
             return results
@@ -925,9 +1234,7 @@ class DbExperimentDataV1(DbExperimentData):
             if index in self._analysis_results:
                 return self._analysis_results[index]
             # Check by name
-            filtered = [
-                result for result in self._analysis_results.values() if result.name == index
-            ]
+            filtered = self._results_for_name(index)
             if not filtered:
                 raise DbExperimentEntryNotFound(_make_not_found_message(index))
             if len(filtered) == 1:
@@ -937,6 +1244,22 @@ class DbExperimentDataV1(DbExperimentData):
 
         raise TypeError(f"Invalid index type {type(index)}.")
 
+    def _results_for_name(self, name: str) -> List[DbAnalysisResult]:
+        """Return the analysis results with the given name.
+
+        Results are indexed by name on the first lookup. The index is dropped
+        when results are added or deleted, and rebuilt if the results container
+        was replaced in the meantime.
+        """
+        with self._analysis_results.lock:
+            container, index = self._results_by_name
+            if container is not self._analysis_results:
+                index = {}
+                for result in self._analysis_results.values():
+                    index.setdefault(result.name, []).append(result)
+                self._results_by_name = (self._analysis_results, index)
+            return list(index.get(name, []))
+
     def save_metadata(self) -> None:
         """Save this experiments metadata to a database service.
 
@@ -971,27 +1294,16 @@ class DbExperimentDataV1(DbExperimentData):
             LOG.warning("Experiment cannot be saved because backend is missing.")
             return
 
-        metadata = copy.deepcopy(self._metadata)
-        metadata["_source"] = self._source
-
-        update_data = {
-            "experiment_id": self._id,
-            "metadata": metadata,
-            "job_ids": self.job_ids,
-            "tags": self.tags,
-            "notes": self.notes,
-        }
+        # Taken before saving, so changes made while saving are saved again later
+        fingerprint = self._metadata_fingerprint()
+        update_data = self._metadata_update_data()
         new_data = {
             "experiment_type": self._type,
             "backend_name": self._backend.name(),
             "provider": self._provider,
         }
-        if self.share_level:
-            update_data["share_level"] = self.share_level
-        if self.parent_id:
-            update_data["parent_id"] = self.parent_id
 
-        self._created_in_db, _ = save_data(
+        saved, _ = save_data(
             is_new=(not self._created_in_db),
             new_func=self._service.create_experiment,
             update_func=self._service.update_experiment,
@@ -999,6 +1311,127 @@ class DbExperimentDataV1(DbExperimentData):
             update_data=update_data,
             json_encoder=self._json_encoder,
         )
+        self._created_in_db = saved
+        if saved:
+            self._saved_metadata_fingerprint = fingerprint
+
+    @contextlib.contextmanager
+    def batch_saves(self, concurrency: int = 10):
+        """Context manager deferring auto-saves until the end of the block.
+
+        While the block is active, metadata saves triggered by auto-save are
+        coalesced into a single save, and figures, analysis results and their
+        deletions are queued instead of being sent to the database service one
+        at a time. The queued writes are issued when the outermost block exits.
+
+        .. code-block:: python
+
+            with expdata.batch_saves():
+                expdata.add_figures(figures)
+                expdata.add_analysis_results(results)
+
+        Args:
+            concurrency: Maximum number of concurrent service calls used to
+                save the queued figures and analysis results.
+
+        Yields:
+            This experiment data.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._flush_pending(concurrency=concurrency)
+
+    def _flush_pending(self, concurrency: int = 10) -> None:
+        """Save the metadata, figures and analysis results queued by :meth:`batch_saves`.
+
+        Args:
+            concurrency: Maximum number of concurrent service calls.
+        """
+        if self._dirty_all:
+            # Everything is saved, including the queued entries
+            self._dirty_all = False
+            self._dirty_metadata = False
+            self._pending_figure_writes = []
+            self._pending_result_writes = []
+            self.save()
+            return
+
+        if self._dirty_metadata:
+            self._dirty_metadata = False
+            self.save_metadata()
+
+        figure_writes, self._pending_figure_writes = self._pending_figure_writes, []
+        result_writes, self._pending_result_writes = self._pending_result_writes, []
+        if not self._service:
+            return
+
+        # Use a dedicated executor so that service calls are not queued behind
+        # the job futures waiting on the shared job executors.
+        with futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+            # Deletions go first in case an entry was deleted and then re-added
+            if self.auto_save:
+                self._delete_pending(executor)
+
+            calls = [executor.submit(result.save) for result in result_writes]
+            with self._figures.lock:
+                # Figures deleted after they were queued are skipped
+                figures = [
+                    (is_new, name, self._figures.get(name, None)) for is_new, name in figure_writes
+                ]
+            for is_new, name, figure in figures:
+                if figure is not None:
+                    calls.append(self._submit_figure_save(executor, is_new, name, figure))
+            for call in calls:
+                call.result()
+
+    def _save_metadata_or_defer(self) -> None:
+        """Save the metadata, or defer the save if inside a :meth:`batch_saves` block."""
+        if self._batch_depth:
+            self._dirty_metadata = True
+        else:
+            self.save_metadata()
+
+    def _delete_pending(self, executor: futures.Executor) -> None:
+        """Delete the figures and analysis results pending deletion from the service.
+
+        The deletions run concurrently in ``executor``. Entries are no longer
+        pending once all deletions have finished, whether or not they succeeded,
+        and failures are reported in a single warning.
+
+        Args:
+            executor: Executor to run the service calls in.
+        """
+        figures = list(self._deleted_figures)
+        result_ids = list(self._deleted_analysis_results)
+        calls = {}
+        for name in figures:
+            call = executor.submit(
+                self._service.delete_figure, experiment_id=self.experiment_id, figure_name=name
+            )
+            calls[call] = f"figure {name}"
+        for result_id in result_ids:
+            call = executor.submit(self._service.delete_analysis_result, result_id=result_id)
+            calls[call] = f"analysis result {result_id}"
+
+        failed = []
+        for call in futures.as_completed(calls):
+            if call.exception() is not None:
+                failed.append(f"{calls[call]}: {call.exception()}")
+
+        for name in figures:
+            self._deleted_figures.pop(name, None)
+        for result_id in result_ids:
+            self._deleted_analysis_results.pop(result_id, None)
+        if failed:
+            LOG.warning(
+                "Experiment service failed to delete %d entries:\n%s",
+                len(failed),
+                "\n".join(failed),
+            )
 
     def save(self) -> None:
         """Save the experiment data to a database service.
@@ -1025,33 +1458,20 @@ class DbExperimentDataV1(DbExperimentData):
             LOG.warning("Could not save experiment metadata to DB, aborting experiment save")
             return
 
-        for result in self._analysis_results.values():
-            result.save()
-
-        for result in self._deleted_analysis_results.copy():
-            with service_exception_to_warning():
-                self._service.delete_analysis_result(result_id=result)
-            self._deleted_analysis_results.remove(result)
+        # Deletions go first in case an entry was deleted and then re-added
+        self._delete_pending(self._service_executor)
 
+        # Analysis results and figures are independent of each other once the
+        # experiment exists, so save them concurrently
+        saves = [
+            self._service_executor.submit(result.save) for result in self._analysis_results.values()
+        ]
         with self._figures.lock:
-            for name, figure in self._figures.items():
-                if figure is None:
-                    continue
-                if isinstance(figure, pyplot.Figure):
-                    figure = plot_to_svg_bytes(figure)
-                data = {"experiment_id": self.experiment_id, "figure": figure, "figure_name": name}
-                save_data(
-                    is_new=True,
-                    new_func=self._service.create_figure,
-                    update_func=self._service.update_figure,
-                    new_data={},
-                    update_data=data,
-                )
-
-        for name in self._deleted_figures.copy():
-            with service_exception_to_warning():
-                self._service.delete_figure(experiment_id=self.experiment_id, figure_name=name)
-            self._deleted_figures.remove(name)
+            figures = [(name, fig) for name, fig in self._figures.items() if fig is not None]
+        for name, figure in figures:
+            saves.append(self._submit_figure_save(self._service_executor, True, name, figure))
+        for call in saves:
+            call.result()
 
         if self.verbose:
             # this field will be implemented in the new service package
@@ -1108,6 +1528,7 @@ class DbExperimentDataV1(DbExperimentData):
 
         # mark it as existing in the DB
         expdata._created_in_db = True
+        expdata._saved_metadata_fingerprint = expdata._metadata_fingerprint()
         return expdata
 
     def jobs(self) -> List[Job]:
@@ -1126,6 +1547,8 @@ class DbExperimentDataV1(DbExperimentData):
         """
         if isinstance(ids, str):
             ids = [ids]
+        if ids:
+            ids = set(ids)
 
         with self._jobs.lock:
             all_cancelled = True
@@ -1133,7 +1556,13 @@ class DbExperimentDataV1(DbExperimentData):
                 if ids and jid not in ids:
                     # Skip cancelling this callback
                     continue
-                if job and job.status() not in JOB_FINAL_STATES:
+                # The data future of a job only returns once the job has finished,
+                # so its status does not need to be queried
+                fut = self._job_futures.get(jid, None)
+                finished = (
+                    fut is not None and fut.done() and not fut.cancelled() and not fut.exception()
+                )
+                if job and not finished and self._get_job_status(jid, job) not in JOB_FINAL_STATES:
                     try:
                         job.cancel()
                         LOG.warning("Cancelled job [Job ID: %s]", jid)
@@ -1174,7 +1603,10 @@ class DbExperimentDataV1(DbExperimentData):
                     # Skip cancelling this callback
                     continue
 
-                # Set event to cancel callback
+                # Mark a queued callback as cancelled before setting the event,
+                # which is also set when its dependencies finish
+                if callback.status == AnalysisStatus.QUEUED:
+                    callback.status = AnalysisStatus.CANCELLED
                 callback.event.set()
 
                 # Check for running callback that can't be cancelled
@@ -1226,41 +1658,47 @@ class DbExperimentDataV1(DbExperimentData):
             The experiment data with finished jobs and post-processing.
         """
         start_time = time.time()
-        with self._job_futures.lock and self._analysis_futures.lock:
-            # Lock threads to get all current job and analysis futures
-            # at the time of function call and then release the lock
-            job_ids = self._job_futures.keys()
-            job_futs = self._job_futures.values()
-            analysis_ids = self._analysis_futures.keys()
-            analysis_futs = self._analysis_futures.values()
-
-        # Wait for futures
-        self._wait_for_futures(job_futs + analysis_futs, name="jobs and analysis", timeout=timeout)
-
-        # Clean up done job futures
-        num_jobs = len(job_ids)
-        for jid, fut in zip(job_ids, job_futs):
-            if (fut.done() and not fut.exception()) or fut.cancelled():
-                if jid in self._job_futures:
-                    del self._job_futures[jid]
-                    num_jobs -= 1
-
-        # Clean up done analysis futures
-        num_analysis = len(analysis_ids)
-        for cid, fut in zip(analysis_ids, analysis_futs):
-            if (fut.done() and not fut.exception()) or fut.cancelled():
-                if cid in self._analysis_futures:
-                    del self._analysis_futures[cid]
-                    num_analysis -= 1
-
-        # Check if more futures got added while this function was running
-        # and block recursively. This could happen if an analysis callback
-        # spawns another callback or creates more jobs
-        if len(self._job_futures) > num_jobs or len(self._analysis_futures) > num_analysis:
-            time_taken = time.time() - start_time
+        while True:
+            with self._job_futures.lock, self._analysis_futures.lock:
+                # Lock threads to get all current job and analysis futures
+                # at the time of the check and then release the lock
+                job_futures = self._job_futures.copy()
+                analysis_futures = self._analysis_futures.copy()
+            job_ids, job_futs = list(job_futures.keys()), list(job_futures.values())
+            analysis_ids = list(analysis_futures.keys())
+            analysis_futs = list(analysis_futures.values())
+
+            # Wait for futures
+            remaining = None
             if timeout is not None:
-                timeout = max(0, timeout - time_taken)
-            return self.block_for_results(timeout=timeout)
+                remaining = max(0, timeout - (time.time() - start_time))
+            self._wait_for_futures(
+                job_futs + analysis_futs, name="jobs and analysis", timeout=remaining
+            )
+
+            # Clean up done job futures
+            num_jobs = len(job_ids)
+            for jid, fut in zip(job_ids, job_futs):
+                if fut.cancelled() or (fut.done() and not fut.exception()):
+                    if jid in self._job_futures:
+                        del self._job_futures[jid]
+                        num_jobs -= 1
+
+            # Clean up done analysis futures
+            num_analysis = len(analysis_ids)
+            for cid, fut in zip(analysis_ids, analysis_futs):
+                if fut.cancelled() or (fut.done() and not fut.exception()):
+                    if cid in self._analysis_futures:
+                        del self._analysis_futures[cid]
+                        num_analysis -= 1
+
+            # Check if more futures got added while waiting and wait for those
+            # too. This could happen if an analysis callback spawns another
+            # callback or creates more jobs
+            if len(self._job_futures) <= num_jobs and len(self._analysis_futures) <= num_analysis:
+                break
+            if timeout is not None and time.time() - start_time >= timeout:
+                break
 
         return self
 
@@ -1279,11 +1717,30 @@ class DbExperimentDataV1(DbExperimentData):
             True if all jobs finished. False if timeout time was reached
             or any jobs were cancelled or had an exception.
         """
-        waited = futures.wait(futs, timeout=timeout)
         value = True
-
-        # Log futures still running after timeout
-        if waited.not_done:
+        try:
+            # Handle futures as they finish so errors are logged without
+            # waiting for the slowest future
+            for fut in futures.as_completed(futs, timeout=timeout):
+                if fut.cancelled():
+                    LOG.debug(
+                        "%s was cancelled before completion [Experiment ID: %s]",
+                        name,
+                        self.experiment_id,
+                    )
+                    value = False
+                    continue
+                ex = fut.exception()
+                if ex:
+                    LOG.error(
+                        "%s raised an exception [Experiment ID: %s]",
+                        name,
+                        self.experiment_id,
+                        exc_info=ex,
+                    )
+                    value = False
+        except futures.TimeoutError:
+            # Log futures still running after timeout
             LOG.info(
                 "Waiting for %s timed out before completion [Experiment ID: %s].",
                 name,
@@ -1291,24 +1748,6 @@ class DbExperimentDataV1(DbExperimentData):
             )
             value = False
 
-        # Check for futures that were cancelled or errorred
-        excepts = ""
-        for fut in waited.done:
-            ex = fut.exception()
-            if ex:
-                excepts += "\n".join(traceback.format_exception(type(ex), ex, ex.__traceback__))
-                value = False
-            elif fut.cancelled():
-                LOG.debug(
-                    "%s was cancelled before completion [Experiment ID: %s]",
-                    name,
-                    self.experiment_id,
-                )
-        if excepts:
-            LOG.error(
-                "%s raised exceptions [Experiment ID: %s]:%s", name, self.experiment_id, excepts
-            )
-
         return value
 
     def status(self) -> ExperimentStatus:
@@ -1335,17 +1774,16 @@ class DbExperimentDataV1(DbExperimentData):
         Returns:
             The experiment status.
         """
-        if all(
-            len(container) == 0
-            for container in [
-                self._data,
-                self._jobs,
-                self._job_futures,
-                self._analysis_callbacks,
-                self._analysis_futures,
-                self._figures,
-                self._analysis_results,
-            ]
+        # Evaluation stops at the first non-empty container, data and jobs
+        # being the most likely ones
+        if not (
+            self._data
+            or self._jobs
+            or self._job_futures
+            or self._analysis_callbacks
+            or self._analysis_futures
+            or self._figures
+            or self._analysis_results
         ):
             return ExperimentStatus.EMPTY
 
@@ -1403,9 +1841,9 @@ class DbExperimentDataV1(DbExperimentData):
                 return JobStatus.DONE
 
             statuses = set()
-            for job in self._jobs.values():
+            for jid, job in self._jobs.items():
                 if job:
-                    statuses.add(job.status())
+                    statuses.add(self._get_job_status(jid, job))
 
         # If any jobs are in non-DONE state return that state
         for stat in [
@@ -1421,6 +1859,19 @@ class DbExperimentDataV1(DbExperimentData):
 
         return JobStatus.DONE
 
+    def _get_job_status(self, job_id: str, job: Job) -> JobStatus:
+        """Return the status of a job.
+
+        Querying the status may require a request to the provider, so the
+        status is only queried until the job reaches a final state.
+        """
+        status = self._final_job_statuses.get(job_id)
+        if status is None:
+            status = job.status()
+            if status in JOB_FINAL_STATES:
+                self._final_job_statuses[job_id] = status
+        return status
+
     def analysis_status(self) -> AnalysisStatus:
         """Return the data analysis post-processing status.
 
@@ -1454,9 +1905,13 @@ class DbExperimentDataV1(DbExperimentData):
         """Return any errors encountered in job execution."""
         errors = []
 
-        # Get any job errors
-        for job in self._jobs.values():
-            if job and job.status() == JobStatus.ERROR:
+        # Get any job errors. A job whose data future is still waiting for its
+        # result has not finished, so its status is not queried.
+        for jid, job in self._jobs.items():
+            fut = self._job_futures.get(jid, None)
+            if fut is not None and not fut.done():
+                continue
+            if job and self._get_job_status(jid, job) == JobStatus.ERROR:
                 if hasattr(job, "error_message"):
                     error_msg = job.error_message()
                 else:
@@ -1465,12 +1920,12 @@ class DbExperimentDataV1(DbExperimentData):
 
         # Get any job futures errors:
         for jid, fut in self._job_futures.items():
-            if fut and fut.done() and fut.exception():
-                ex = fut.exception()
-                errors.append(
-                    f"[Job ID: {jid}]"
-                    "\n".join(traceback.format_exception(type(ex), ex, ex.__traceback__))
-                )
+            if not fut or not fut.done() or fut.cancelled():
+                continue
+            ex = fut.exception()
+            if ex:
+                tb_text = "".join(traceback.format_exception(type(ex), ex, ex.__traceback__))
+                errors.append(f"\n[Job ID: {jid}]: {tb_text}")
         return "".join(errors)
 
     def analysis_errors(self) -> str:
@@ -1529,7 +1984,7 @@ class DbExperimentDataV1(DbExperimentData):
         new_instance._tags = self._tags
         new_instance._jobs = self._jobs.copy_object()
         new_instance._share_level = self._share_level
-        new_instance._metadata = copy.deepcopy(self._metadata)
+        new_instance._metadata = _fast_copy(self._metadata)
         new_instance._notes = self._notes
         new_instance._auto_save = self._auto_save
         new_instance._service = self._service
@@ -1549,12 +2004,16 @@ class DbExperimentDataV1(DbExperimentData):
         # Copy results and figures.
         # This requires analysis callbacks to finish
         self._wait_for_futures(self._analysis_futures.values(), name="analysis")
-        with self._analysis_results.lock:
-            new_instance._analysis_results = ThreadSafeOrderedDict()
-            new_instance.add_analysis_results([result.copy() for result in self.analysis_results()])
-        with self._figures.lock:
-            new_instance._figures = ThreadSafeOrderedDict()
-            new_instance.add_figures(self._figures.values())
+        # With auto-save enabled the copies are uploaded together on exit
+        with new_instance.batch_saves():
+            with self._analysis_results.lock:
+                new_instance._analysis_results = ThreadSafeOrderedDict()
+                new_instance.add_analysis_results(
+                    [result.copy() for result in self.analysis_results()]
+                )
+            with self._figures.lock:
+                new_instance._figures = ThreadSafeOrderedDict()
+                new_instance.add_figures(self._figures.values())
 
         return new_instance
 
@@ -1575,9 +2034,9 @@ class DbExperimentDataV1(DbExperimentData):
             raise DbExperimentDataError(
                 f"The `tags` field of {type(self).__name__} must be a list."
             )
-        self._tags = np.unique(new_tags).tolist()
+        self._tags = list(dict.fromkeys(new_tags))
         if self.auto_save:
-            self.save_metadata()
+            self._save_metadata_or_defer()
 
     @property
     def metadata(self) -> Dict:
@@ -1673,7 +2132,7 @@ class DbExperimentDataV1(DbExperimentData):
         """
         self._share_level = new_level
         if self.auto_save:
-            self.save_metadata()
+            self._save_metadata_or_defer()
 
     @property
     def notes(self) -> str:
@@ -1693,7 +2152,7 @@ class DbExperimentDataV1(DbExperimentData):
         """
         self._notes = new_notes
         if self.auto_save:
-            self.save_metadata()
+            self._save_metadata_or_defer()
 
     @property
     def service(self) -> Optional[DatabaseServiceV1]:
@@ -1730,7 +2189,9 @@ class DbExperimentDataV1(DbExperimentData):
             raise DbExperimentDataError("An experiment service is already being used.")
         self._service = service
         for result in self._analysis_results.values():
-            result.service = service
+            # Results added with this service already use it
+            if result.service is not service:
+                result.service = service
         with contextlib.suppress(Exception):
             self.auto_save = self._service.options.get("auto_save", False)
 
@@ -1751,7 +2212,10 @@ class DbExperimentDataV1(DbExperimentData):
             save_val: Whether to do auto-save.
         """
         if save_val is True and not self._auto_save:
-            self.save()
+            if self._batch_depth:
+                self._dirty_all = True
+            else:
+                self.save()
         self._auto_save = save_val
         for res in self._analysis_results.values():
             # Setting private variable directly to avoid duplicate save. This
@@ -1764,27 +2228,26 @@ class DbExperimentDataV1(DbExperimentData):
         return self._source
 
     def __repr__(self):
-        out = f"{type(self).__name__}({self.experiment_type}"
-        out += f", {self.experiment_id}"
+        parts = [str(self.experiment_type), str(self.experiment_id)]
         if self._parent_id:
-            out += f", parent_id={self._parent_id}"
+            parts.append(f"parent_id={self._parent_id}")
         if self._tags:
-            out += f", tags={self._tags}"
-        if self.job_ids:
-            out += f", job_ids={self.job_ids}"
+            parts.append(f"tags={self._tags}")
+        job_ids = self.job_ids
+        if job_ids:
+            parts.append(f"job_ids={job_ids}")
         if self._share_level:
-            out += f", share_level={self._share_level}"
+            parts.append(f"share_level={self._share_level}")
         if self._metadata:
-            out += f", metadata=<{len(self._metadata)} items>"
-        if self.figure_names:
-            out += f", figure_names={self.figure_names}"
+            parts.append(f"metadata=<{len(self._metadata)} items>")
+        figure_names = self.figure_names
+        if figure_names:
+            parts.append(f"figure_names={figure_names}")
         if self.notes:
-            out += f", notes={self.notes}"
-        if self._extra_data:
-            for key, val in self._extra_data.items():
-                out += f", {key}={repr(val)}"
-        out += ")"
-        return out
+            parts.append(f"notes={self.notes}")
+        for key, val in self._extra_data.items():
+            parts.append(f"{key}={repr(val)}")
+        return f"{type(self).__name__}({', '.join(parts)})"
 
     def __getattr__(self, name: str) -> Any:
         try:
@@ -1798,31 +2261,38 @@ class DbExperimentDataV1(DbExperimentData):
         # Since Job objects are not serializable this removes
         # them from the jobs dict and returns {job_id: None}
         # that can be used to retrieve jobs from a service after loading
-        jobs = ThreadSafeOrderedDict()
-        with self._jobs.lock:
-            for jid in self._jobs.keys():
-                jobs[jid] = None
-        return jobs
+        return ThreadSafeOrderedDict(self._jobs.keys())
 
     def _safe_serialize_figures(self):
         """Return serializable object for stored figures"""
         # Convert any MPL figures into SVG images before serializing
+        # Rendering is done outside the lock so that figures can be added while
+        # serializing. Matplotlib is not thread safe, so figures are rendered in turn.
+        with self._figures.lock:
+            items = list(self._figures.items())
         figures = ThreadSafeOrderedDict()
+        for name, figure in items:
+            figures[name] = self._figure_svg(name, figure)
         with self._figures.lock:
-            for name, figure in self._figures.items():
-                if isinstance(figure, pyplot.Figure):
-                    figures[name] = plot_to_svg_bytes(figure)
-                else:
-                    figures[name] = figure
+            # Drop renderings of figures that were replaced or removed
+            self._figure_svg_cache = {
+                name: cached
+                for name, cached in self._figure_svg_cache.items()
+                if self._figures.get(name, None) is cached[0]
+            }
         return figures
 
     def __json_encode__(self):
-        if any(not fut.done() for fut in self._job_futures.values()):
+        # The counters avoid scanning the futures of finished experiments. A
+        # future is done slightly before its done callback updates the counter.
+        if self._unfinished_jobs and any(not fut.done() for fut in self._job_futures.values()):
             raise QiskitError(
                 "Not all experiment jobs have finished. Jobs must be "
                 "cancelled or done to serialize experiment data."
             )
-        if any(not fut.done() for fut in self._analysis_futures.values()):
+        if self._unfinished_analysis and any(
+            not fut.done() for fut in self._analysis_futures.values()
+        ):
             raise QiskitError(
                 "Not all experiment analysis has finished. Analysis must be "
                 "cancelled or done to serialize experiment data."
@@ -1871,15 +2341,20 @@ class DbExperimentDataV1(DbExperimentData):
         ret = cls()
         for att, att_val in value.items():
             setattr(ret, att, att_val)
+        for att in ["_deleted_figures", "_deleted_analysis_results"]:
+            # Convert the deques used by older versions
+            setattr(ret, att, dict.fromkeys(getattr(ret, att)))
         return ret
 
     def __getstate__(self):
-        if any(not fut.done() for fut in self._job_futures.values()):
+        if self._unfinished_jobs and any(not fut.done() for fut in self._job_futures.values()):
             LOG.warning(
                 "Not all job futures have finished."
                 " Data from running futures will not be serialized."
             )
-        if any(not fut.done() for fut in self._analysis_futures.values()):
+        if self._unfinished_analysis and any(
+            not fut.done() for fut in self._analysis_futures.values()
+        ):
             LOG.warning(
                 "Not all analysis callbacks have finished."
                 " Results from running callbacks will not be serialized."
@@ -1888,11 +2363,13 @@ class DbExperimentDataV1(DbExperimentData):
         state = self.__dict__.copy()
 
         # Remove non-pickleable attributes
-        for key in ["_job_futures", "_analysis_futures", "_analysis_executor", "_monitor_executor"]:
+        for key in ["_job_futures", "_analysis_futures", "_analysis_executor"]:
             del state[key]
 
         # Convert figures to SVG
         state["_figures"] = self._safe_serialize_figures()
+        state["_figure_svg_cache"] = {}
+        state["_missing_figures"] = {}
 
         # Handle partially pickleable attributes
         state["_jobs"] = self._safe_serialize_jobs()
@@ -1900,8 +2377,13 @@ class DbExperimentDataV1(DbExperimentData):
         return state
 
     def __setstate__(self, state):
+        # Defaults for attributes missing from objects pickled by older versions
+        self._analysis_results_loaded = False
+        self._saved_metadata_fingerprint = None
         self.__dict__.update(state)
+        for att in ["_deleted_figures", "_deleted_analysis_results"]:
+            # Convert the deques used by older versions
+            setattr(self, att, dict.fromkeys(getattr(self, att)))
         # Initialize non-pickled attributes
-        self._job_futures = ThreadSafeOrderedDict()
-        self._analysis_futures = ThreadSafeOrderedDict()
+        self._init_transient_state()
         self._analysis_executor = futures.ThreadPoolExecutor(max_workers=1)
@@ -12,14 +12,16 @@
 
 """Experiment utility functions."""
 
+import gzip
 import io
 import logging
 import threading
-import traceback
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from itertools import islice
 from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Callable, Tuple, Dict, Any, Union, Type, Optional
+from typing import BinaryIO, Callable, Tuple, Dict, Any, Union, Type, Optional
 import json
 
 import dateutil.parser
@@ -42,9 +44,22 @@ from ..version import __version__ as experiments_version
 
 LOG = logging.getLogger(__name__)
 
+# Exceptions raised by experiment services for entries that do not exist
+ENTRY_NOT_FOUND_ERRORS = (DbExperimentEntryNotFound,)
 
+# Prefix marking figure data compressed by compress_figure
+FIGURE_COMPRESSION_PREFIX = b"QXGZ1"
+if HAS_IBMQ:
+    ENTRY_NOT_FOUND_ERRORS += (IBMExperimentEntryNotFound,)
+
+
+@lru_cache(maxsize=1)
 def qiskit_version():
-    """Return the Qiskit version."""
+    """Return the Qiskit version.
+
+    The installed version cannot change during a session, so the value is
+    only looked up once.
+    """
     try:
         return pkg_resources.get_distribution("qiskit").version
     except Exception:  # pylint: disable=broad-except
@@ -84,6 +99,20 @@ def utc_to_local(utc_dt: datetime) -> datetime:
     return local_dt
 
 
+def write_plot_svg(figure: "pyplot.Figure", output: BinaryIO) -> None:
+    """Write a pyplot Figure as SVG to a binary file object.
+
+    Args:
+        figure: Figure to be converted.
+        output: File object the SVG is written to.
+    """
+    opaque_color = list(figure.get_facecolor())
+    opaque_color[3] = 1.0  # set alpha to opaque
+    figure.savefig(
+        output, format="svg", facecolor=tuple(opaque_color), edgecolor="none", bbox_inches="tight"
+    )
+
+
 def plot_to_svg_bytes(figure: "pyplot.Figure") -> bytes:
     """Convert a pyplot Figure to SVG in bytes.
 
@@ -93,16 +122,36 @@ def plot_to_svg_bytes(figure: "pyplot.Figure") -> bytes:
     Returns:
         Figure in bytes.
     """
-    buf = io.BytesIO()
-    opaque_color = list(figure.get_facecolor())
-    opaque_color[3] = 1.0  # set alpha to opaque
-    figure.savefig(
-        buf, format="svg", facecolor=tuple(opaque_color), edgecolor="none", bbox_inches="tight"
-    )
-    buf.seek(0)
-    figure_data = buf.read()
-    buf.close()
-    return figure_data
+    with io.BytesIO() as buf:
+        write_plot_svg(figure, buf)
+        return buf.getvalue()
+
+
+def compress_figure(figure: bytes) -> bytes:
+    """Compress figure data for upload to a database service.
+
+    Args:
+        figure: Figure data to be compressed.
+
+    Returns:
+        The gzip compressed figure data, prefixed with ``FIGURE_COMPRESSION_PREFIX``.
+    """
+    return FIGURE_COMPRESSION_PREFIX + gzip.compress(figure, compresslevel=6)
+
+
+def decompress_figure(figure: Union[bytes, Any]) -> Union[bytes, Any]:
+    """Decompress figure data compressed by :func:`compress_figure`.
+
+    Args:
+        figure: Figure data retrieved from a database service.
+
+    Returns:
+        The decompressed figure data. Data without ``FIGURE_COMPRESSION_PREFIX``
+        is returned unchanged.
+    """
+    if isinstance(figure, bytes) and figure.startswith(FIGURE_COMPRESSION_PREFIX):
+        return gzip.decompress(figure[len(FIGURE_COMPRESSION_PREFIX) :])
+    return figure
 
 
 def save_data(
@@ -161,7 +210,7 @@ def save_data(
         raise DbExperimentDataError("Unable to determine the existence of the entry.")
     except Exception:  # pylint: disable=broad-except
         # Don't fail the experiment just because its data cannot be saved.
-        LOG.error("Unable to save the experiment data: %s", traceback.format_exc())
+        LOG.error("Unable to save the experiment data.", exc_info=True)
         return False, None
 
 
@@ -262,6 +311,43 @@ class ThreadSafeOrderedDict(ThreadSafeContainer):
         with self._lock:
             return list(self._container.keys())
 
+    def key_at(self, index):
+        """Return the key at the given position without building the key list.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        with self._lock:
+            if index < 0:
+                index += len(self._container)
+            if index < 0:
+                raise IndexError("ThreadSafeOrderedDict index out of range")
+            try:
+                return next(islice(self._container, index, index + 1))
+            except StopIteration:
+                raise IndexError("ThreadSafeOrderedDict index out of range") from None
+
+    def value_at(self, index):
+        """Return the value at the given position without building the value list.
+
+        Raises:
+            IndexError: If the index is out of range.
+        """
+        with self._lock:
+            return self._container[self.key_at(index)]
+
+    def slice_values(self, index: slice):
+        """Return the values in the given slice.
+
+        Only the values up to the end of the slice are visited when it has
+        a positive step.
+        """
+        with self._lock:
+            start, stop, step = index.indices(len(self._container))
+            if step < 0:
+                return list(self._container.values())[index]
+            return list(islice(self._container.values(), start, stop, step))
+
     def values(self):
         """Return all values."""
         with self._lock:
@@ -271,6 +357,11 @@ class ThreadSafeOrderedDict(ThreadSafeContainer):
         """Return the key value pairs."""
         return self._container.items()
 
+    def update(self, other):
+        """Update the dictionary with the key value pairs from ``other``."""
+        with self._lock:
+            self._container.update(other)
+
 
 class ThreadSafeList(ThreadSafeContainer):
     """Thread safe list."""
@@ -283,3 +374,8 @@ class ThreadSafeList(ThreadSafeContainer):
         """Append to the list."""
         with self._lock:
             self._container.append(value)
+
+    def extend(self, values):
+        """Extend the list with the given values."""
+        with self._lock:
+            self._container.extend(values)
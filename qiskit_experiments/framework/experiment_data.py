@@ -123,8 +123,10 @@ class ExperimentData(DbExperimentData):
         """
         if index is None:
             return self._child_data.values()
-        if isinstance(index, (int, slice)):
-            return self._child_data.values()[index]
+        if isinstance(index, int):
+            return self._child_data.value_at(index)
+        if isinstance(index, slice):
+            return self._child_data.slice_values(index)
         if isinstance(index, str):
             return self._child_data[index]
         raise QiskitError(f"Invalid index type {type(index)}.")
@@ -153,6 +155,13 @@ class ExperimentData(DbExperimentData):
         for data in self.child_data():
             data.save_metadata()
 
+    def _metadata_fingerprint(self) -> Optional[str]:
+        # Child experiment IDs are only copied to the metadata when it is saved
+        fingerprint = super()._metadata_fingerprint()
+        if fingerprint is None:
+            return None
+        return fingerprint + ",".join(self._child_data.keys())
+
     def _save_experiment_metadata(self):
         # Copy child experiment IDs to metadata
         if self._child_data:
@@ -220,7 +229,7 @@ class ExperimentData(DbExperimentData):
             data.share_level = new_level
             data.auto_save = original_auto_save
         if self.auto_save:
-            self.save_metadata()
+            self._save_metadata_or_defer()
 
     def add_tags_recursive(self, tags2add: List[str]) -> None:
         """Add tags to this experiment itself and its descendants
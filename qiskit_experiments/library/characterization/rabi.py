@@ -26,6 +26,10 @@ from qiskit_experiments.framework import BaseExperiment, Options
 from qiskit_experiments.framework.restless_mixin import RestlessMixin
 from qiskit_experiments.curve_analysis import ParameterRepr, OscillationAnalysis
 
+# Default amplitudes shared by all experiments, read-only so that they cannot be changed in place
+_DEFAULT_AMPLITUDES = np.linspace(-0.95, 0.95, 51)
+_DEFAULT_AMPLITUDES.setflags(write=False)
+
 
 class Rabi(BaseExperiment, RestlessMixin):
     """An experiment that scans a pulse amplitude to calibrate rotations between 0 and 1.
@@ -82,7 +86,7 @@ class Rabi(BaseExperiment, RestlessMixin):
         """
         options = super()._default_experiment_options()
 
-        options.amplitudes = np.linspace(-0.95, 0.95, 51)
+        options.amplitudes = _DEFAULT_AMPLITUDES
         options.schedule = None
 
         return options
@@ -120,12 +124,19 @@ class Rabi(BaseExperiment, RestlessMixin):
 
         self.experiment_options.schedule = schedule
 
+        # The schedule the template circuit was built from, the circuit and its parameter
+        self._template_cache = None
+
     def _pre_circuit(self) -> QuantumCircuit:
         """A circuit with operations to perform before the Rabi."""
         return QuantumCircuit(1)
 
     def _template_circuit(self) -> Tuple[QuantumCircuit, Parameter]:
-        """Return the template quantum circuit."""
+        """Return the template quantum circuit.
+
+        The calibration of the Rabi gate is not attached to the template. The
+        circuits bind the schedule and add it for each amplitude.
+        """
         sched = self.experiment_options.schedule
         param = next(iter(sched.parameters))
 
@@ -140,7 +151,6 @@ class Rabi(BaseExperiment, RestlessMixin):
         circuit = self._pre_circuit()
         circuit.append(gate, (0,))
         circuit.measure_active()
-        circuit.add_calibration(gate, self._physical_qubits, sched, params=[param])
 
         return circuit, param
 
@@ -152,21 +162,30 @@ class Rabi(BaseExperiment, RestlessMixin):
             will have a different value of the scanned amplitude.
         """
 
-        # Create template circuit
-        circuit, param = self._template_circuit()
+        # Create template circuit, unless it was already built for this schedule
+        sched = self.experiment_options.schedule
+        if self._template_cache is None or self._template_cache[0] is not sched:
+            self._template_cache = (sched, *self._template_circuit())
+        _, circuit, param = self._template_cache
 
         # Create the circuits to run
+        amplitudes = np.round(np.asarray(self.experiment_options.amplitudes, dtype=float), 6)
+        base_metadata = {
+            "experiment_type": self._type,
+            "qubits": self.physical_qubits,
+            "unit": "arb. unit",
+        }
         circs = []
-        for amp in self.experiment_options.amplitudes:
-            amp = np.round(amp, decimals=6)
+        for amp in amplitudes:
+            # Binding the schedule here avoids deep copying it with the circuit calibrations
             assigned_circ = circuit.assign_parameters({param: amp}, inplace=False)
-            assigned_circ.metadata = {
-                "experiment_type": self._type,
-                "qubits": self.physical_qubits,
-                "xval": amp,
-                "unit": "arb. unit",
-                "amplitude": amp,
-            }
+            assigned_circ.add_calibration(
+                self.__gate_name__,
+                self._physical_qubits,
+                sched.assign_parameters({param: amp}, inplace=False),
+                params=[float(amp)],
+            )
+            assigned_circ.metadata = {**base_metadata, "xval": amp, "amplitude": amp}
 
             circs.append(assigned_circ)
 
@@ -13,6 +13,7 @@
 """Test Rabi amplitude Experiment class."""
 from test.base import QiskitExperimentsTestCase
 import unittest
+from unittest import mock
 import numpy as np
 
 from qiskit import QuantumCircuit, transpile
@@ -104,6 +105,31 @@ class TestRabiEndToEnd(QiskitExperimentsTestCase):
         self.assertEqual(data.status(), ExperimentStatus.ERROR)
         self.assertEqual(len(result), 0)
 
+    def test_template_circuit_reused(self):
+        """Test the template circuit is only rebuilt when the schedule changes."""
+        rabi = Rabi(self.qubit, self.sched)
+        with mock.patch.object(
+            Rabi, "_template_circuit", autospec=True, side_effect=Rabi._template_circuit
+        ) as template:
+            circs = rabi.circuits()
+            self.assertEqual(
+                [circ.metadata for circ in rabi.circuits()], [circ.metadata for circ in circs]
+            )
+            self.assertEqual(template.call_count, 1)
+
+            with pulse.build(name="x") as sched:
+                pulse.play(
+                    pulse.Gaussian(160, Parameter("amp"), 40), pulse.DriveChannel(self.qubit)
+                )
+            rabi.set_experiment_options(schedule=sched)
+            circs = rabi.circuits()
+            self.assertEqual(template.call_count, 2)
+            self.assertEqual(circs[0].calibrations["Rabi"][((self.qubit,), (-0.95,))].name, "x")
+            self.assertIsInstance(
+                circs[0].calibrations["Rabi"][((self.qubit,), (-0.95,))].blocks[0].pulse,
+                pulse.Gaussian,
+            )
+
     def test_experiment_config(self):
         """Test converting to and from config works"""
         exp = Rabi(0, self.sched)
@@ -23,10 +23,13 @@ import threading
 import json
 import re
 import uuid
+import gzip
+from collections import deque
 
 import matplotlib.pyplot as plt
 import numpy as np
 
+from qiskit import QiskitError
 from qiskit.test.mock import FakeMelbourne
 from qiskit.result import Result
 from qiskit.providers import JobV1 as Job
@@ -138,6 +141,73 @@ class TestDbExperimentData(QiskitExperimentsTestCase):
         self.assertEqual(expected, [sdata["counts"] for sdata in exp_data.data()])
         self.assertIn(a_job.job_id(), exp_data.job_ids)
 
+    def test_add_duplicate_jobs(self):
+        """Test adding duplicate jobs."""
+        job = mock.create_autospec(Job, instance=True)
+        job.job_id.return_value = "some_job_id"
+        job.result.return_value = self._get_job_result(2)
+        job.status.return_value = JobStatus.DONE
+
+        exp_data = DbExperimentData(backend=self.backend, experiment_type="qiskit_test")
+        exp_data.add_jobs([job, job])
+        exp_data.add_jobs(job)
+        self.assertExperimentDone(exp_data)
+        self.assertEqual(exp_data.job_ids, ["some_job_id"])
+        self.assertEqual(len(exp_data.data()), 2)
+
+    def test_add_jobs_backend_outside_lock(self):
+        """Test the job backend is resolved without holding the jobs lock."""
+        exp_data = DbExperimentData(backend=self.backend, experiment_type="qiskit_test")
+        lock_free = []
+
+        def _try_lock():
+            acquired = exp_data._jobs.lock.acquire(blocking=False)
+            if acquired:
+                exp_data._jobs.lock.release()
+            lock_free.append(acquired)
+
+        def _job_backend():
+            # The lock is reentrant, so try to acquire it from another thread
+            thread = threading.Thread(target=_try_lock)
+            thread.start()
+            thread.join()
+            return self.backend
+
+        job = mock.create_autospec(Job, instance=True)
+        job.backend.side_effect = _job_backend
+        job.result.return_value = self._get_job_result(2)
+        job.status.return_value = JobStatus.DONE
+        exp_data.add_jobs(job)
+        self.assertExperimentDone(exp_data)
+        self.assertEqual([True], lock_free)
+
+    def test_final_job_status_cached(self):
+        """Test the status of a finished job is not queried again."""
+        job = mock.create_autospec(Job, instance=True)
+        job.result.return_value = self._get_job_result(2)
+        job.status.return_value = JobStatus.DONE
+
+        exp_data = DbExperimentData(backend=self.backend, experiment_type="qiskit_test")
+        exp_data.add_jobs(job)
+        self.assertExperimentDone(exp_data)
+        for _ in range(3):
+            self.assertEqual(exp_data.job_status(), JobStatus.DONE)
+        job.status.assert_called_once()
+
+    def test_cancel_finished_jobs(self):
+        """Test cancelling jobs does not query jobs whose data was added."""
+        job = mock.create_autospec(Job, instance=True)
+        job.job_id.return_value = "some_job_id"
+        job.result.return_value = self._get_job_result(2)
+        job.status.return_value = JobStatus.DONE
+
+        exp_data = DbExperimentData(backend=self.backend, experiment_type="qiskit_test")
+        exp_data.add_jobs(job)
+        exp_data._job_futures["some_job_id"].result()
+        self.assertTrue(exp_data.cancel_jobs())
+        job.status.assert_not_called()
+        job.cancel.assert_not_called()
+
     def test_add_data_job_callback(self):
         """Test add job data with callback."""
 
@@ -252,6 +322,24 @@ class TestDbExperimentData(QiskitExperimentsTestCase):
             results.get_counts(), [sdata["counts"] for sdata in exp_data.data(results.job_id)]
         )
 
+    def test_get_data_by_job_id(self):
+        """Test getting data by job ID as more data is added."""
+        exp_data = DbExperimentData(experiment_type="qiskit_test")
+        results = self._get_job_result(2)
+        exp_data.add_data(results)
+        self.assertEqual(len(exp_data.data(results.job_id)), 2)
+
+        exp_data.add_data([{"counts": {"00": 10}, "job_id": "other_job"}, results])
+        self.assertEqual(len(exp_data.data(results.job_id)), 4)
+        self.assertEqual(
+            exp_data.data("other_job"), [{"counts": {"00": 10}, "job_id": "other_job"}]
+        )
+
+        exp_data._data.clear()
+        exp_data.add_data([{"counts": {"00": 10}}] * 3 + [{"counts": {"00": 1}, "job_id": "new"}])
+        self.assertEqual(exp_data.data(results.job_id), [])
+        self.assertEqual(len(exp_data.data("new")), 1)
+
     def test_add_figure(self):
         """Test adding a new figure."""
         hello_bytes = str.encode("hello world")
@@ -331,6 +419,91 @@ class TestDbExperimentData(QiskitExperimentsTestCase):
         self.assertEqual(kwargs["figure"], hello_bytes)
         self.assertEqual(kwargs["experiment_id"], exp_data.experiment_id)
 
+    def test_add_figure_save_compressed(self):
+        """Test saving and retrieving a compressed figure."""
+        figure_bytes = str.encode("hello world" * 1000)
+        service = self._set_mock_service()
+        service.supports_compressed_figures = True
+        exp_data = DbExperimentData(backend=self.backend, experiment_type="qiskit_test")
+        fig_name = exp_data.add_figures(figure_bytes, save_figure=True)
+        _, kwargs = service.create_figure.call_args
+        self.assertTrue(kwargs["figure"].startswith(b"QXGZ1"))
+        self.assertLess(len(kwargs["figure"]), len(figure_bytes))
+        self.assertEqual(exp_data.figure(fig_name), figure_bytes)
+
+        service.figure.return_value = kwargs["figure"]
+        loaded_data = DbExperimentData(
+            experiment_type="qiskit_test", service=service, figure_names=[fig_name]
+        )
+        self.assertEqual(loaded_data.figure(fig_name), figure_bytes)
+
+    def test_add_figure_save_uncompressed(self):
+        """Test figures are not compressed unless the service supports it."""
+        figure_bytes = str.encode("hello world" * 1000)
+        service = self._set_mock_service()
+        service.preferences = {"compress_figures": True}
+        exp_data = DbExperimentData(backend=self.backend, experiment_type="qiskit_test")
+        exp_data.add_figures(figure_bytes, save_figure=True)
+        _, kwargs = service.create_figure.call_args
+        self.assertEqual(kwargs["figure"], figure_bytes)
+
+    def test_get_figure_gzip_unchanged(self):
+        """Test gzip data retrieved without the compression prefix is not decompressed."""
+        figure_bytes = gzip.compress(str.encode("hello world"))[:-4]
+        service = mock.create_autospec(DatabaseServiceV1, instance=True)
+        service.figure.return_value = figure_bytes
+        exp_data = DbExperimentData(
+            experiment_type="qiskit_test", service=service, figure_names=["hello.gz"]
+        )
+        self.assertEqual(exp_data.figure("hello.gz"), figure_bytes)
+
+    def test_missing_figure_not_refetched(self):
+        """Test a figure missing from the service is not requested repeatedly."""
+        service = mock.create_autospec(DatabaseServiceV1, instance=True)
+        service.figure.side_effect = DbExperimentEntryNotFound
+        exp_data = DbExperimentData(
+            experiment_type="qiskit_test", service=service, figure_names=["missing.svg"]
+        )
+        for _ in range(2):
+            with self.assertRaises(DbExperimentEntryNotFound):
+                exp_data.figure("missing.svg")
+        service.figure.assert_called_once()
+
+    def test_missing_figure_service_error(self):
+        """Test the error raised by the service for a missing figure is not changed."""
+
+        class ServiceEntryNotFound(Exception):
+            """Entry not found error of a service."""
+
+        service = mock.create_autospec(DatabaseServiceV1, instance=True)
+        service.figure.side_effect = ServiceEntryNotFound("Figure not found.")
+        exp_data = DbExperimentData(
+            experiment_type="qiskit_test", service=service, figure_names=["missing.svg"]
+        )
+        with mock.patch(
+            "qiskit_experiments.database_service.db_experiment_data.ENTRY_NOT_FOUND_ERRORS",
+            (DbExperimentEntryNotFound, ServiceEntryNotFound),
+        ):
+            errors = []
+            for _ in range(2):
+                with self.assertRaises(ServiceEntryNotFound) as context:
+                    exp_data.figure("missing.svg")
+                errors.append(context.exception)
+        service.figure.assert_called_once()
+        self.assertIsNot(errors[0], errors[1])
+        self.assertEqual(errors[0].args, errors[1].args)
+
+    def test_service_preferences_fetched_once(self):
+        """Test service preferences are not fetched for every figure."""
+        service = self._set_mock_service()
+        preferences = mock.PropertyMock(return_value={"compress_figures": True})
+        type(service).preferences = preferences
+        exp_data = DbExperimentData(backend=self.backend, experiment_type="qiskit_test")
+        for _ in range(3):
+            exp_data.add_figures(str.encode("hello world" * 1000), save_figure=True)
+        self.assertEqual(service.create_figure.call_count, 3)
+        preferences.assert_called_once()
+
     def test_add_figure_bad_input(self):
         """Test adding figures with bad input."""
         exp_data = DbExperimentData(backend=self.backend, experiment_type="qiskit_test")
@@ -356,6 +529,39 @@ class TestDbExperimentData(QiskitExperimentsTestCase):
         with open(file_name, "rb") as file:
             self.assertEqual(expected_figure, file.read())
 
+    def test_get_pyplot_figure_to_file(self):
+        """Test writing a matplotlib figure to a file."""
+        exp_data = DbExperimentData(experiment_type="qiskit_test")
+        figure = get_non_gui_ax().get_figure()
+        exp_data.add_figures(figure, figure_names="plot.svg")
+
+        file_name = uuid.uuid4().hex
+        self.addCleanup(os.remove, file_name)
+        num_bytes = exp_data.figure("plot.svg", file_name)
+        with open(file_name, "rb") as file:
+            content = file.read()
+        self.assertEqual(num_bytes, len(content))
+        self.assertIn(b"<svg", content)
+
+    def test_figure_svg_reused(self):
+        """Test unchanged matplotlib figures are rendered once when serialized."""
+        exp_data = DbExperimentData(experiment_type="qiskit_test")
+        ax = get_non_gui_ax()
+        ax.plot([0, 1], [0, 1])
+        exp_data.add_figures(ax.get_figure(), figure_names="plot.svg")
+
+        with mock.patch(
+            "qiskit_experiments.database_service.db_experiment_data.plot_to_svg_bytes",
+            return_value=b"<svg></svg>",
+        ) as plot_to_svg:
+            exp_data._safe_serialize_figures()
+            exp_data._safe_serialize_figures()
+            self.assertEqual(plot_to_svg.call_count, 1)
+
+            ax.set_title("changed")
+            exp_data._safe_serialize_figures()
+            self.assertEqual(plot_to_svg.call_count, 2)
+
     def test_delete_figure(self):
         """Test deleting a figure."""
         exp_data = DbExperimentData(experiment_type="qiskit_test")
@@ -416,6 +622,38 @@ class TestDbExperimentData(QiskitExperimentsTestCase):
 
         self.assertEqual(results, exp_data.analysis_results())
 
+    def test_get_analysis_results_by_name(self):
+        """Test getting analysis results by name."""
+        exp_data = DbExperimentData(experiment_type="qiskit_test")
+        results = []
+        for idx in range(4):
+            res = mock.MagicMock()
+            res.result_id = f"result_{idx}"
+            res.name = "T1" if idx % 2 else "EPC"
+            results.append(res)
+        exp_data.add_analysis_results(results[:3])
+
+        self.assertEqual(results[1], exp_data.analysis_results("T1"))
+        self.assertEqual([results[0], results[2]], exp_data.analysis_results("EPC"))
+
+        exp_data.add_analysis_results(results[3])
+        self.assertEqual([results[1], results[3]], exp_data.analysis_results("T1"))
+
+        exp_data.delete_analysis_result("result_1")
+        self.assertEqual(results[3], exp_data.analysis_results("T1"))
+
+    def test_empty_analysis_results_retrieved_once(self):
+        """Test an experiment without analysis results is not queried again."""
+        service = mock.create_autospec(DatabaseServiceV1, instance=True)
+        service.analysis_results.return_value = []
+        exp_data = DbExperimentData(experiment_type="qiskit_test", service=service)
+        for _ in range(2):
+            self.assertEqual(exp_data.analysis_results(), [])
+        service.analysis_results.assert_called_once()
+
+        exp_data.analysis_results(refresh=True)
+        self.assertEqual(service.analysis_results.call_count, 2)
+
     def test_delete_analysis_result(self):
         """Test deleting analysis result."""
         exp_data = DbExperimentData(experiment_type="qiskit_test")
@@ -431,6 +669,25 @@ class TestDbExperimentData(QiskitExperimentsTestCase):
                 exp_data.delete_analysis_result(del_key)
                 self.assertRaises(DbExperimentEntryNotFound, exp_data.analysis_results, res_id)
 
+    def test_save_delete_failures(self):
+        """Test failed deletions are reported in a single warning."""
+        exp_data = DbExperimentData(backend=self.backend, experiment_type="qiskit_test")
+        service = mock.create_autospec(DatabaseServiceV1, instance=True)
+        service.delete_figure.side_effect = DbExperimentEntryNotFound("No figure")
+        service.delete_analysis_result.side_effect = DbExperimentEntryNotFound("No result")
+        exp_data.add_figures(str.encode("hello world"))
+        exp_data.add_analysis_results(mock.MagicMock())
+        exp_data.delete_analysis_result(0)
+        exp_data.delete_figure(0)
+        exp_data.service = service
+
+        with self.assertLogs("qiskit_experiments", "WARNING") as logs:
+            exp_data.save()
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn("failed to delete 2 entries", logs.output[0])
+        self.assertFalse(exp_data._deleted_figures)
+        self.assertFalse(exp_data._deleted_analysis_results)
+
     def test_save_metadata(self):
         """Test saving experiment metadata."""
         exp_data = DbExperimentData(backend=self.backend, experiment_type="qiskit_test")
@@ -501,6 +758,18 @@ class TestDbExperimentData(QiskitExperimentsTestCase):
         with self.assertRaises(DbExperimentDataError):
             exp_data.service = mock_service
 
+    def test_set_service_result_with_service(self):
+        """Test setting the service already used by an analysis result."""
+        mock_service = mock.MagicMock()
+        exp_data = DbExperimentData(experiment_type="qiskit_test")
+        result = DbAnalysisResult(
+            "RESULT1", True, ["Q0"], exp_data.experiment_id, service=mock_service
+        )
+        exp_data.add_analysis_results(result)
+        exp_data.service = mock_service
+        self.assertEqual(mock_service, exp_data.service)
+        self.assertEqual(mock_service, result.service)
+
     def test_new_backend_has_service(self):
         """Test changing backend doesn't change existing service."""
         orig_service = self._set_mock_service()
@@ -540,6 +809,106 @@ class TestDbExperimentData(QiskitExperimentsTestCase):
                     called.assert_called_once()
                 service.reset_mock()
 
+    def test_auto_save_unchanged_metadata(self):
+        """Test auto save skips saving metadata that has not changed."""
+        service = self._set_mock_service()
+        exp_data = DbExperimentData(backend=self.backend, experiment_type="qiskit_test")
+        exp_data.auto_save = True
+        service.reset_mock()
+
+        exp_data.add_figures(str.encode("hello world"))
+        service.create_figure.assert_called_once()
+        service.update_experiment.assert_not_called()
+
+        exp_data.metadata["foo"] = "bar"
+        exp_data.add_figures(str.encode("hello world"))
+        service.update_experiment.assert_called_once()
+
+        # Reading the metadata does not make it dirty
+        service.reset_mock()
+        self.assertEqual(exp_data.metadata["foo"], "bar")
+        exp_data.add_figures(str.encode("hello world"))
+        service.update_experiment.assert_not_called()
+
+    def test_auto_save_tags_in_place(self):
+        """Test auto save persists tags modified in place."""
+        service = self._set_mock_service()
+        exp_data = DbExperimentData(backend=self.backend, experiment_type="qiskit_test")
+        exp_data.auto_save = True
+        service.reset_mock()
+
+        exp_data.tags.append("foo")
+        exp_data.add_figures(str.encode("hello world"))
+        service.update_experiment.assert_called_once()
+        self.assertEqual(service.update_experiment.call_args.kwargs["tags"], ["foo"])
+
+    def test_batch_saves(self):
+        """Test auto saves are deferred until the end of a batch."""
+        service = self._set_mock_service()
+        exp_data = DbExperimentData(backend=self.backend, experiment_type="qiskit_test")
+        exp_data.auto_save = True
+        service.reset_mock()
+        mock_result = mock.MagicMock()
+
+        with exp_data.batch_saves():
+            exp_data.metadata["foo"] = "bar"
+            exp_data.add_figures(str.encode("hello world"), "hello.svg")
+            exp_data.add_figures(str.encode("foo"), "foo.svg")
+            exp_data.delete_figure("foo.svg")
+            exp_data.add_analysis_results(mock_result)
+            service.create_figure.assert_not_called()
+            service.delete_figure.assert_not_called()
+            service.update_experiment.assert_not_called()
+            mock_result.save.assert_not_called()
+
+        service.update_experiment.assert_called_once()
+        service.create_figure.assert_called_once()
+        _, kwargs = service.create_figure.call_args
+        self.assertEqual(kwargs["figure_name"], "hello.svg")
+        service.delete_figure.assert_called_once()
+        mock_result.save.assert_called_once()
+
+    def test_batch_saves_setters(self):
+        """Test setter and job saves are deferred until the end of a batch."""
+        service = self._set_mock_service()
+        exp_data = DbExperimentData(backend=self.backend, experiment_type="qiskit_test")
+        exp_data.auto_save = True
+        service.reset_mock()
+        job = mock.create_autospec(Job, instance=True)
+        job.backend.return_value = self.backend
+        job.status.return_value = JobStatus.DONE
+        job.result.return_value = self._get_job_result(1)
+
+        with exp_data.batch_saves():
+            exp_data.tags = ["foo"]
+            exp_data.share_level = "public"
+            exp_data.notes = "some notes"
+            exp_data.add_jobs(job)
+            exp_data.block_for_results()
+            service.update_experiment.assert_not_called()
+
+        service.update_experiment.assert_called_once()
+        _, kwargs = service.update_experiment.call_args
+        self.assertEqual(kwargs["tags"], ["foo"])
+        self.assertEqual(kwargs["notes"], "some notes")
+
+    def test_batch_saves_enable_auto_save(self):
+        """Test the full save on enabling auto save is deferred until the end of a batch."""
+        service = self._set_mock_service()
+        exp_data = DbExperimentData(backend=self.backend, experiment_type="qiskit_test")
+        exp_data.add_figures(str.encode("hello world"), "hello.svg")
+        service.reset_mock()
+
+        with exp_data.batch_saves():
+            exp_data.auto_save = True
+            exp_data.tags = ["foo"]
+            service.create_experiment.assert_not_called()
+            service.create_figure.assert_not_called()
+
+        service.create_experiment.assert_called_once()
+        service.update_experiment.assert_not_called()
+        service.create_figure.assert_called_once()
+
     def test_status_job_pending(self):
         """Test experiment status when job is pending."""
         job1 = mock.create_autospec(Job, instance=True)
@@ -649,6 +1018,8 @@ class TestDbExperimentData(QiskitExperimentsTestCase):
         self.assertEqual(["foo"], exp_data.tags)
         exp_data.tags = ["bar"]
         self.assertEqual(["bar"], exp_data.tags)
+        exp_data.tags = ["foo", "bar", "foo", "baz"]
+        self.assertEqual(["foo", "bar", "baz"], exp_data.tags)
 
     def test_cancel_jobs(self):
         """Test canceling experiment jobs."""
@@ -714,6 +1085,24 @@ class TestDbExperimentData(QiskitExperimentsTestCase):
         self.assertEqual(exp_data.analysis_status(), AnalysisStatus.CANCELLED)
         self.assertEqual(exp_data.status(), ExperimentStatus.CANCELLED)
 
+    def test_cancel_queued_analysis(self):
+        """Test canceling a queued analysis callback whose dependencies are done."""
+        event = threading.Event()
+        self.addCleanup(event.set)
+        run_analysis = []
+
+        exp_data = DbExperimentData(experiment_type="qiskit_test")
+        # Keep the analysis executor busy so the callback stays queued
+        for _ in range(2):
+            exp_data._analysis_executor.submit(event.wait, 15)
+        exp_data.add_analysis_callback(lambda *args: run_analysis.append(True))
+        exp_data.cancel_analysis()
+        event.set()
+
+        exp_data.block_for_results()
+        self.assertEqual(run_analysis, [])
+        self.assertEqual(exp_data.analysis_status(), AnalysisStatus.CANCELLED)
+
     def test_partial_cancel_analysis(self):
         """Test canceling experiment analysis."""
 
@@ -820,6 +1209,36 @@ class TestDbExperimentData(QiskitExperimentsTestCase):
             self.assertEqual(exp_data.job_status(), JobStatus.CANCELLED)
             self.assertEqual(exp_data.status(), ExperimentStatus.CANCELLED)
 
+    def test_add_jobs_timeout_with_failed_job(self):
+        """Test add_jobs timeout still cancels jobs when another job failed."""
+
+        event = threading.Event()
+        self.addCleanup(event.set)
+
+        def _job_result():
+            event.wait(timeout=15)
+            raise ValueError("Job was cancelled.")
+
+        def _failed_result():
+            raise ValueError("Job failed.")
+
+        failed_job = mock.create_autospec(Job, instance=True)
+        failed_job.job_id.return_value = "failed"
+        failed_job.result = _failed_result
+        failed_job.status.return_value = JobStatus.RUNNING
+
+        job = mock.create_autospec(Job, instance=True)
+        job.job_id.return_value = "1234"
+        job.result = _job_result
+        job.cancel = event.set
+        job.status = lambda: JobStatus.CANCELLED if event.is_set() else JobStatus.RUNNING
+
+        exp_data = DbExperimentData(experiment_type="qiskit_test")
+        with self.assertLogs("qiskit_experiments", "WARNING"):
+            exp_data.add_jobs([failed_job, job], timeout=0.5)
+            self.assertTrue(event.wait(timeout=5))
+            exp_data.block_for_results()
+
     def test_metadata_serialization(self):
         """Test experiment metadata serialization."""
         metadata = {"complex": 2 + 3j, "numpy": np.zeros(2)}
@@ -832,6 +1251,75 @@ class TestDbExperimentData(QiskitExperimentsTestCase):
         self.assertEqual(metadata["complex"], deserialized["complex"])
         self.assertEqual(metadata["numpy"].all(), deserialized["numpy"].all())
 
+    def test_deleted_figures_serialization(self):
+        """Test pending figure deletions survive serialization."""
+        exp_data = DbExperimentData(experiment_type="qiskit_test")
+        exp_data.add_figures(str.encode("hello world"), figure_names="hello.svg")
+        exp_data.delete_figure("hello.svg")
+
+        serialized = json.dumps(exp_data, cls=exp_data._json_encoder)
+        deserialized = json.loads(serialized, cls=exp_data._json_decoder)
+        self.assertEqual(["hello.svg"], list(deserialized._deleted_figures))
+
+    def test_unpickle_legacy_state(self):
+        """Test unpickling state saved before the caches and pending saves existed."""
+        exp_data = DbExperimentData(experiment_type="qiskit_test")
+        exp_data.add_data(self._get_job_result(1))
+        exp_data.add_figures(str.encode("hello world"), figure_names="hello.svg")
+        exp_data.add_analysis_results(
+            DbAnalysisResult("result1", 1, ["Q0"], exp_data.experiment_id)
+        )
+
+        state = exp_data.__getstate__()
+        for key in [
+            "_final_job_statuses",
+            "_data_by_job",
+            "_data_by_job_state",
+            "_figure_svg_cache",
+            "_missing_figures",
+            "_analysis_results_loaded",
+            "_results_by_name",
+            "_saved_metadata_fingerprint",
+            "_batch_depth",
+            "_dirty_metadata",
+            "_pending_figure_writes",
+            "_pending_result_writes",
+        ]:
+            del state[key]
+        state["_deleted_figures"] = deque(["old.svg"])
+        state["_deleted_analysis_results"] = deque(["old_result"])
+
+        unpickled = DbExperimentData.__new__(DbExperimentData)
+        unpickled.__setstate__(state)
+        self.assertEqual(1, len(unpickled.data("some_job_id")))
+        self.assertEqual("result1", unpickled.analysis_results("result1").name)
+        unpickled.delete_figure("hello.svg")
+        self.assertEqual(["old.svg", "hello.svg"], list(unpickled._deleted_figures))
+        self.assertEqual(["old_result"], list(unpickled._deleted_analysis_results))
+        with unpickled.batch_saves():
+            unpickled.tags = ["foo"]
+        self.assertEqual(["foo"], unpickled.tags)
+
+    def test_serialize_running_job(self):
+        """Test serialization is refused only while a job is running."""
+        event = threading.Event()
+        self.addCleanup(event.set)
+        job = mock.create_autospec(Job, instance=True)
+        job.job_id.return_value = "1234"
+        job.result = lambda: event.wait(timeout=15) and self._get_job_result(1)
+        job.status.return_value = JobStatus.DONE
+
+        exp_data = DbExperimentData(experiment_type="qiskit_test")
+        exp_data.add_jobs(job)
+        self.assertEqual(exp_data._unfinished_jobs, 1)
+        with self.assertRaises(QiskitError):
+            json.dumps(exp_data, cls=exp_data._json_encoder)
+
+        event.set()
+        exp_data.block_for_results()
+        serialized = json.dumps(exp_data, cls=exp_data._json_encoder)
+        self.assertIn("1234", json.loads(serialized, cls=exp_data._json_decoder).job_ids)
+
     def test_errors(self):
         """Test getting experiment error message."""
 
@@ -856,6 +1344,40 @@ class TestDbExperimentData(QiskitExperimentsTestCase):
         self.assertIn("Kaboom", ",".join(cm.output))
         self.assertTrue(re.match(r".*5678.*Kaboom!", exp_data.errors(), re.DOTALL))
 
+    def test_job_future_errors(self):
+        """Test getting error messages of failed job futures."""
+
+        def _job_result():
+            raise ValueError("Kaboom!")
+
+        job = mock.create_autospec(Job, instance=True)
+        job.job_id.return_value = "1234"
+        job.result = _job_result
+        job.status.return_value = JobStatus.RUNNING
+
+        exp_data = DbExperimentData(experiment_type="qiskit_test")
+        with self.assertLogs(logger="qiskit_experiments.database_service", level="WARN"):
+            exp_data.add_jobs(job)
+            exp_data.block_for_results()
+        errors = exp_data.job_errors()
+        self.assertEqual(errors.count("[Job ID: 1234]"), 1)
+        self.assertIn("ValueError: Kaboom!", errors)
+
+    def test_errors_running_job(self):
+        """Test getting errors does not query the status of running jobs."""
+        event = threading.Event()
+        self.addCleanup(event.set)
+
+        job = mock.create_autospec(Job, instance=True)
+        job.job_id.return_value = "1234"
+        job.result = lambda *args, **kwargs: event.wait(timeout=15)
+        job.status.return_value = JobStatus.RUNNING
+
+        exp_data = DbExperimentData(experiment_type="qiskit_test")
+        exp_data.add_jobs(job)
+        self.assertEqual(exp_data.errors(), "")
+        job.status.assert_not_called()
+
     def test_simple_methods_from_callback(self):
         """Test that simple methods used in call back function don't hang
 
@@ -947,6 +1469,19 @@ class TestDbExperimentData(QiskitExperimentsTestCase):
         self.assertTrue("RuntimeError: YOU FAIL" in exp_data.analysis_errors())
         self.assertEqual(len(results), 2)
 
+    def test_metadata_copied(self):
+        """Test metadata passed at initialization is copied."""
+        flat = {"foo": 1, "bar": "baz"}
+        nested = {"foo": [1, 2], "bar": {"baz": np.array([1.0, 2.0])}}
+        for metadata in [flat, nested]:
+            with self.subTest(metadata=metadata):
+                exp_data = DbExperimentData(experiment_type="qiskit_test", metadata=metadata)
+                self.assertIsNot(exp_data.metadata, metadata)
+                self.assertEqual(repr(exp_data.metadata), repr(metadata))
+        exp_data = DbExperimentData(experiment_type="qiskit_test", metadata=nested)
+        nested["foo"].append(3)
+        self.assertEqual(exp_data.metadata["foo"], [1, 2])
+
     def test_source(self):
         """Test getting experiment source."""
         exp_data = DbExperimentData(experiment_type="qiskit_test")